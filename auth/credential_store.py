@@ -9,6 +9,7 @@ import json
 import logging
 import os
 import re
+import threading
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import List, Optional
@@ -549,6 +550,30 @@ def _selected_backend() -> str:
 
 # Global credential store instance
 _credential_store: Optional[CredentialStore] = None
+_credential_store_lock = threading.Lock()
+
+
+def _create_credential_store() -> CredentialStore:
+    """Build the credential store for the configured backend."""
+    backend = get_selected_backend()
+    if backend == "gcs":
+        # GCS backend does not support list_users(), which is required for
+        # single-user mode. Reject unless OAuth 2.1 is enabled.
+        oauth21_enabled = _parse_bool_env(os.getenv("MCP_ENABLE_OAUTH21", "false"))
+        if not oauth21_enabled:
+            raise ValueError(
+                "GCSCredentialStore requires MCP_ENABLE_OAUTH21=true. "
+                "The GCS backend does not support list_users(), which is "
+                "required for single-user mode. Use LocalDirectoryCredentialStore "
+                "for single-user deployments, or enable OAuth 2.1 mode."
+            )
+        return GCSCredentialStore()
+    if backend == "local_directory":
+        return LocalDirectoryCredentialStore()
+    raise ValueError(
+        f"Unsupported WORKSPACE_MCP_CREDENTIAL_STORE_BACKEND: {backend!r}. "
+        f"Expected 'local_directory' or 'gcs'."
+    )
 
 
 def get_credential_store() -> CredentialStore:
@@ -561,27 +586,13 @@ def get_credential_store() -> CredentialStore:
     global _credential_store
 
     if _credential_store is None:
-        backend = get_selected_backend()
-        if backend == "gcs":
-            # GCS backend does not support list_users(), which is required for
-            # single-user mode. Reject unless OAuth 2.1 is enabled.
-            oauth21_enabled = _parse_bool_env(os.getenv("MCP_ENABLE_OAUTH21", "false"))
-            if not oauth21_enabled:
-                raise ValueError(
-                    "GCSCredentialStore requires MCP_ENABLE_OAUTH21=true. "
-                    "The GCS backend does not support list_users(), which is "
-                    "required for single-user mode. Use LocalDirectoryCredentialStore "
-                    "for single-user deployments, or enable OAuth 2.1 mode."
+        with _credential_store_lock:
+            # Re-check under the lock so concurrent first calls share one store
+            if _credential_store is None:
+                _credential_store = _create_credential_store()
+                logger.info(
+                    f"Initialized credential store: {type(_credential_store).__name__}"
                 )
-            _credential_store = GCSCredentialStore()
-        elif backend == "local_directory":
-            _credential_store = LocalDirectoryCredentialStore()
-        else:
-            raise ValueError(
-                f"Unsupported WORKSPACE_MCP_CREDENTIAL_STORE_BACKEND: {backend!r}. "
-                f"Expected 'local_directory' or 'gcs'."
-            )
-        logger.info(f"Initialized credential store: {type(_credential_store).__name__}")
 
     return _credential_store
 
@@ -594,5 +605,6 @@ def set_credential_store(store: CredentialStore):
         store: Credential store instance to use
     """
     global _credential_store
-    _credential_store = store
+    with _credential_store_lock:
+        _credential_store = store
     logger.info(f"Set credential store: {type(store).__name__}")
@@ -28,6 +28,7 @@ from core.config import (
     get_oauth_redirect_uri,
 )
 from core.context import get_fastmcp_session_id
+from core.api_json import get_api_json_model
 
 # Try to import FastMCP dependencies (may not be available in all environments)
 try:
@@ -1204,7 +1205,12 @@ def get_user_info(
     try:
         # Using googleapiclient discovery to get user info
         # Requires 'google-api-python-client' library
-        service = build("oauth2", "v2", http=_build_authorized_http(credentials))
+        service = build(
+            "oauth2",
+            "v2",
+            http=_build_authorized_http(credentials),
+            model=get_api_json_model(),
+        )
         user_info = service.userinfo().get().execute()
         logger.info(f"Successfully fetched user info: {user_info.get('email')}")
         return user_info
@@ -1350,7 +1356,12 @@ async def get_authenticated_google_service(
         raise GoogleAuthenticationError(auth_response)
 
     try:
-        service = build(service_name, version, http=_build_authorized_http(credentials))
+        service = build(
+            service_name,
+            version,
+            http=_build_authorized_http(credentials),
+            model=get_api_json_model(),
+        )
         log_user_email = user_google_email
 
         # Try to get email from credentials if needed for validation
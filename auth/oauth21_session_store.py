@@ -9,9 +9,11 @@ session context management and credential conversion functionality.
 import contextvars
 import json
 import logging
+import mmap
 import os
-from typing import Dict, Optional, Any, Tuple, Callable, IO
-from threading import RLock
+import time
+from typing import Dict, Optional, Any, Tuple, Callable
+from threading import Lock, RLock
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
 
@@ -20,25 +22,76 @@ try:
 except ImportError:  # pragma: no cover - Windows
     fcntl = None
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from fastmcp.server.auth import AccessToken
 from google.oauth2.credentials import Credentials
 from auth.oauth_config import is_external_oauth21_provider
 
 logger = logging.getLogger(__name__)
 
+# Minimum interval between full sweeps for expired OAuth states. Individual
+# states are still checked for expiry when they are consumed.
+OAUTH_STATE_CLEANUP_INTERVAL_SECONDS = 60
+
+
+# Extra flags for raw os.open calls on OAuth state files (no-ops where unsupported)
+_OAUTH_STATE_OPEN_FLAGS = getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
 
-def _lock_file_exclusive(file_handle: IO[str]) -> None:
+# State files at least this large are memory-mapped instead of read into a
+# buffer; below it a single read() is cheaper than mmap/munmap.
+_OAUTH_STATE_MMAP_MIN_BYTES = 64 * 1024
+
+
+def _lock_file_exclusive(fd: int) -> None:
     """Acquire an exclusive lock when supported by the platform."""
     if fcntl is None:
         return
-    fcntl.flock(file_handle.fileno(), fcntl.LOCK_EX)
+    fcntl.flock(fd, fcntl.LOCK_EX)
 
 
-def _unlock_file(file_handle: IO[str]) -> None:
+def _unlock_file(fd: int) -> None:
     """Release a file lock when supported by the platform."""
     if fcntl is None:
         return
-    fcntl.flock(file_handle.fileno(), fcntl.LOCK_UN)
+    fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def _read_fd(fd: int) -> bytes:
+    """Read a file descriptor to EOF, sized from fstat to avoid regrowing buffers."""
+    size = os.fstat(fd).st_size
+    chunks = []
+    while True:
+        chunk = os.read(fd, max(size, 4096))
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _write_fd(fd: int, payload: bytes) -> None:
+    """Write the whole payload, retrying on short writes."""
+    view = memoryview(payload)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _loads_oauth_states(raw: Any) -> Any:
+    """Parse OAuth state JSON from any bytes-like object."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(bytes(raw))
+
+
+def _dumps_oauth_states(payload: Dict[str, Any]) -> bytes:
+    """Serialize OAuth states in one pass, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
 
 
 def _get_default_oauth_state_file() -> str:
@@ -127,7 +180,9 @@ def set_session_context(context: Optional[SessionContext]):
     _current_session_context.set(context)
     if context:
         logger.debug(
-            f"Set session context: session_id={context.session_id}, user_id={context.user_id}"
+            "Set session context: session_id=%s, user_id=%s",
+            context.session_id,
+            context.user_id,
         )
     else:
         logger.debug("Cleared session context")
@@ -242,9 +297,20 @@ class OAuth21SessionStore:
         ] = {}  # Maps session ID -> authenticated user email (immutable)
         self._oauth_states: Dict[str, Dict[str, Any]] = {}
         self._oauth_state_file = oauth_state_file or _get_default_oauth_state_file()
+        self._oauth_state_lock_file = self._oauth_state_file + ".lock"
+        # Parsed copy of the shared state file, reused while the file is unchanged
+        self._oauth_state_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._oauth_state_cache_signature: Optional[Tuple[int, int, int]] = None
+        self._oauth_state_directory_ready = False
+        self._last_oauth_state_cleanup = 0.0
         self._lock = RLock()
+        # OAuth state operations never re-enter and do file I/O, so they use a
+        # separate plain lock and do not block session/credential lookups.
+        self._oauth_state_lock = Lock()
 
     def _ensure_oauth_state_directory(self) -> None:
+        if self._oauth_state_directory_ready:
+            return
         state_dir = os.path.dirname(self._oauth_state_file)
         if state_dir:
             os.makedirs(state_dir, mode=0o700, exist_ok=True)
@@ -257,66 +323,55 @@ class OAuth21SessionStore:
                 os.chmod(self._oauth_state_file, 0o600)
             except OSError:
                 logger.debug("Failed to update OAuth state file permissions")
+        self._oauth_state_directory_ready = True
 
-    def _serialize_oauth_state_entry(
-        self, state_info: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        return {
-            "session_id": state_info.get("session_id"),
-            "code_verifier": state_info.get("code_verifier"),
-            "created_at": (
-                state_info["created_at"].astimezone(timezone.utc).isoformat()
-                if state_info.get("created_at")
-                else None
-            ),
-            "expires_at": (
-                state_info["expires_at"].astimezone(timezone.utc).isoformat()
-                if state_info.get("expires_at")
-                else None
-            ),
-        }
+    def _coerce_oauth_state_timestamp(self, raw_value: Any) -> Optional[float]:
+        """Normalize a stored timestamp to epoch seconds, accepting legacy ISO-8601 strings."""
+        if isinstance(raw_value, str):
+            try:
+                parsed = datetime.fromisoformat(raw_value.replace("Z", "+00:00"))
+            except (TypeError, ValueError):
+                return None
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed.timestamp()
+        if isinstance(raw_value, bool) or not isinstance(raw_value, (int, float)):
+            return None
+        return raw_value
 
     def _deserialize_oauth_state_entry(
         self, state_info: Dict[str, Any]
     ) -> Dict[str, Any]:
-        deserialized = dict(state_info)
+        # Entries come straight from the JSON parser and are owned by the
+        # caller, so normalize them in place and keep the on-disk shape.
         for field_name in ("created_at", "expires_at"):
-            raw_value = deserialized.get(field_name)
-            if isinstance(raw_value, str):
-                try:
-                    parsed = datetime.fromisoformat(raw_value.replace("Z", "+00:00"))
-                except (TypeError, ValueError):
-                    deserialized[field_name] = None
-                    continue
-                if parsed.tzinfo is None:
-                    parsed = parsed.replace(tzinfo=timezone.utc)
-                deserialized[field_name] = parsed
-        return deserialized
+            raw_value = state_info.get(field_name)
+            if type(raw_value) is not float:
+                state_info[field_name] = self._coerce_oauth_state_timestamp(raw_value)
+        return state_info
+
+    def _is_oauth_state_expired(self, state_info: Dict[str, Any], now: float) -> bool:
+        expires_at = state_info.get("expires_at")
+        return bool(expires_at) and expires_at <= now
 
     def _remove_expired_oauth_states_from_dict(
-        self, oauth_states: Dict[str, Dict[str, Any]]
+        self, oauth_states: Dict[str, Dict[str, Any]], now: float
     ) -> bool:
-        now = datetime.now(timezone.utc)
         expired_states = [
             state
             for state, data in oauth_states.items()
-            if data.get("expires_at") and data["expires_at"] <= now
+            if self._is_oauth_state_expired(data, now)
         ]
         for state in expired_states:
             del oauth_states[state]
         return bool(expired_states)
 
-    def _load_oauth_states_from_file_handle(
-        self, file_handle: IO[str]
-    ) -> Tuple[Dict[str, Dict[str, Any]], bool]:
-        file_handle.seek(0)
-        raw = file_handle.read()
-        if not raw.strip():
-            return {}, False
-
+    def _parse_oauth_states(self, raw: Any) -> Tuple[Dict[str, Dict[str, Any]], bool]:
         try:
-            payload = json.loads(raw)
-        except json.JSONDecodeError:
+            payload = _loads_oauth_states(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            if not bytes(raw).strip():
+                return {}, False
             logger.warning(
                 "OAuth state file %s is invalid JSON; resetting it",
                 self._oauth_state_file,
@@ -330,54 +385,128 @@ class OAuth21SessionStore:
             )
             return {}, True
 
+        # Deserialize and drop expired entries in a single pass.
+        now = time.time()
         oauth_states = {}
+        removed_expired = False
         for state, state_info in payload.items():
-            if isinstance(state_info, dict):
-                oauth_states[state] = self._deserialize_oauth_state_entry(state_info)
-        removed_expired = self._remove_expired_oauth_states_from_dict(oauth_states)
+            if not isinstance(state_info, dict):
+                continue
+            entry = self._deserialize_oauth_state_entry(state_info)
+            if self._is_oauth_state_expired(entry, now):
+                removed_expired = True
+                continue
+            oauth_states[state] = entry
         return oauth_states, removed_expired
 
-    def _write_oauth_states_to_file_handle(
+    def _get_oauth_state_file_signature(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat_result = os.stat(self._oauth_state_file)
+        except FileNotFoundError:
+            return None
+        return stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size
+
+    def _load_oauth_states_with_cache(
+        self,
+    ) -> Tuple[Dict[str, Dict[str, Any]], bool]:
+        """Return cached states when the shared file is unchanged since our last access."""
+        signature = self._get_oauth_state_file_signature()
+        if signature is None:
+            return {}, False
+        if (
+            self._oauth_state_cache is not None
+            and signature == self._oauth_state_cache_signature
+        ):
+            return self._oauth_state_cache, False
+        try:
+            fd = os.open(self._oauth_state_file, os.O_RDONLY | _OAUTH_STATE_OPEN_FLAGS)
+        except FileNotFoundError:
+            return {}, False
+        try:
+            size = os.fstat(fd).st_size
+            if size == 0:
+                return {}, False
+            if size >= _OAUTH_STATE_MMAP_MIN_BYTES:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        return self._parse_oauth_states(view)
+            return self._parse_oauth_states(_read_fd(fd))
+        finally:
+            os.close(fd)
+
+    def _invalidate_oauth_state_cache(self) -> None:
+        self._oauth_state_cache = None
+        self._oauth_state_cache_signature = None
+
+    def _write_oauth_states_to_file(
         self,
-        file_handle: IO[str],
         oauth_states: Dict[str, Dict[str, Any]],
     ) -> None:
-        serialized = {
-            state: self._serialize_oauth_state_entry(state_info)
-            for state, state_info in oauth_states.items()
-        }
-        file_handle.seek(0)
-        file_handle.truncate()
-        json.dump(serialized, file_handle, indent=2, sort_keys=True)
-        file_handle.flush()
-        os.fsync(file_handle.fileno())
+        """Write states to a temp file and atomically swap it into place."""
+        payload = _dumps_oauth_states(oauth_states)
+        tmp_path = self._oauth_state_file + ".tmp"
         try:
-            os.chmod(self._oauth_state_file, 0o600)
-        except OSError:
-            logger.debug("Failed to update OAuth state file permissions")
+            fd = os.open(
+                tmp_path,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _OAUTH_STATE_OPEN_FLAGS,
+                0o600,
+            )
+            try:
+                _write_fd(fd, payload)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, self._oauth_state_file)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
 
     def _update_shared_oauth_states(
         self,
         mutator: Callable[[Dict[str, Dict[str, Any]]], Tuple[Any, bool]],
     ) -> Tuple[Any, Dict[str, Dict[str, Any]]]:
         self._ensure_oauth_state_directory()
-        fd = os.open(self._oauth_state_file, os.O_RDWR | os.O_CREAT, 0o600)
-        with os.fdopen(fd, "r+", encoding="utf-8") as file_handle:
-            try:
-                os.chmod(self._oauth_state_file, 0o600)
-            except OSError:
-                logger.debug("Failed to update OAuth state file permissions")
-            _lock_file_exclusive(file_handle)
+        # The state file itself is replaced on every write, so cross-process
+        # locking happens on a stable sidecar file instead.
+        lock_flags = os.O_RDWR | os.O_CREAT | _OAUTH_STATE_OPEN_FLAGS
+        try:
+            lock_fd = os.open(self._oauth_state_lock_file, lock_flags, 0o600)
+        except FileNotFoundError:
+            # Directory was removed since it was last prepared; recreate it.
+            self._oauth_state_directory_ready = False
+            self._ensure_oauth_state_directory()
+            lock_fd = os.open(self._oauth_state_lock_file, lock_flags, 0o600)
+        try:
+            _lock_file_exclusive(lock_fd)
             try:
-                oauth_states, cleaned_expired = (
-                    self._load_oauth_states_from_file_handle(file_handle)
+                oauth_states, cleaned_expired = self._load_oauth_states_with_cache()
+                now = time.time()
+                if now - self._last_oauth_state_cleanup >= (
+                    OAUTH_STATE_CLEANUP_INTERVAL_SECONDS
+                ):
+                    self._cleanup_expired_oauth_states_locked(now)
+                    if self._remove_expired_oauth_states_from_dict(oauth_states, now):
+                        cleaned_expired = True
+                    self._last_oauth_state_cleanup = now
+                try:
+                    result, mutated = mutator(oauth_states)
+                    if cleaned_expired or mutated:
+                        self._write_oauth_states_to_file(oauth_states)
+                except Exception:
+                    self._invalidate_oauth_state_cache()
+                    raise
+                self._oauth_state_cache = oauth_states
+                self._oauth_state_cache_signature = (
+                    self._get_oauth_state_file_signature()
                 )
-                result, mutated = mutator(oauth_states)
-                if cleaned_expired or mutated:
-                    self._write_oauth_states_to_file_handle(file_handle, oauth_states)
                 return result, oauth_states
             finally:
-                _unlock_file(file_handle)
+                _unlock_file(lock_fd)
+        finally:
+            os.close(lock_fd)
 
     def _persist_oauth_state_to_shared_store(
         self, state: str, state_info: Dict[str, Any]
@@ -397,7 +526,11 @@ class OAuth21SessionStore:
             oauth_states: Dict[str, Dict[str, Any]],
         ) -> Tuple[Optional[Dict[str, Any]], bool]:
             state_info = oauth_states.pop(state, None)
-            return state_info, state_info is not None
+            if state_info is None:
+                return None, False
+            if self._is_oauth_state_expired(state_info, time.time()):
+                return None, True
+            return state_info, True
 
         result, _ = self._update_shared_oauth_states(mutator)
         return result
@@ -410,6 +543,7 @@ class OAuth21SessionStore:
         def mutator(
             oauth_states: Dict[str, Dict[str, Any]],
         ) -> Tuple[Optional[Tuple[str, Dict[str, Any]]], bool]:
+            now = time.time()
             matching_states = [
                 state
                 for state, state_info in oauth_states.items()
@@ -417,29 +551,26 @@ class OAuth21SessionStore:
                     (allow_any_session and session_id is None)
                     or state_info.get("session_id") == session_id
                 )
+                and not self._is_oauth_state_expired(state_info, now)
             ]
             if not matching_states:
                 return None, False
 
             latest_state = max(
                 matching_states,
-                key=lambda s: oauth_states[s].get(
-                    "created_at",
-                    datetime.min.replace(tzinfo=timezone.utc),
-                ),
+                key=lambda s: oauth_states[s].get("created_at") or 0,
             )
             return (latest_state, oauth_states.pop(latest_state)), True
 
         result, _ = self._update_shared_oauth_states(mutator)
         return result
 
-    def _cleanup_expired_oauth_states_locked(self):
-        """Remove expired OAuth state entries. Caller must hold lock."""
-        now = datetime.now(timezone.utc)
+    def _cleanup_expired_oauth_states_locked(self, now: float):
+        """Remove expired OAuth state entries. Caller must hold the OAuth state lock."""
         expired_states = [
             state
             for state, data in self._oauth_states.items()
-            if data.get("expires_at") and data["expires_at"] <= now
+            if self._is_oauth_state_expired(data, now)
         ]
         for state in expired_states:
             del self._oauth_states[state]
@@ -461,10 +592,9 @@ class OAuth21SessionStore:
         if expires_in_seconds < 0:
             raise ValueError("expires_in_seconds must be non-negative")
 
-        with self._lock:
-            self._cleanup_expired_oauth_states_locked()
-            now = datetime.now(timezone.utc)
-            expiry = now + timedelta(seconds=expires_in_seconds)
+        with self._oauth_state_lock:
+            now = time.time()
+            expiry = now + expires_in_seconds
             state_info = {
                 "session_id": session_id,
                 "expires_at": expiry,
@@ -473,11 +603,12 @@ class OAuth21SessionStore:
             }
             self._oauth_states[state] = state_info
             self._persist_oauth_state_to_shared_store(state, state_info)
-            logger.debug(
-                "Stored OAuth state %s (expires at %s)",
-                state[:8] if len(state) > 8 else state,
-                expiry.isoformat(),
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Stored OAuth state %s (expires at %s)",
+                    state[:8] if len(state) > 8 else state,
+                    datetime.fromtimestamp(expiry, tz=timezone.utc).isoformat(),
+                )
 
     def validate_and_consume_oauth_state(
         self,
@@ -500,8 +631,7 @@ class OAuth21SessionStore:
         if not state:
             raise ValueError("Missing OAuth state parameter")
 
-        with self._lock:
-            self._cleanup_expired_oauth_states_locked()
+        with self._oauth_state_lock:
             state_info = self._pop_oauth_state_from_shared_store(state)
             if not state_info:
                 self._oauth_states.pop(state, None)
@@ -549,8 +679,7 @@ class OAuth21SessionStore:
         Returns:
             State metadata dict, or None if no states are stored.
         """
-        with self._lock:
-            self._cleanup_expired_oauth_states_locked()
+        with self._oauth_state_lock:
             shared_state = self._consume_latest_oauth_state_from_shared_store(
                 initiating_session_id,
                 allow_any_session=allow_any_session,
@@ -617,19 +746,19 @@ class OAuth21SessionStore:
                     if old_mcp_session_id in self._mcp_session_mapping:
                         del self._mcp_session_mapping[old_mcp_session_id]
                         logger.debug(
-                            f"Removed stale MCP session mapping: {old_mcp_session_id}"
+                            "Removed stale MCP session mapping: %s", old_mcp_session_id
                         )
                     if old_mcp_session_id in self._session_auth_binding:
                         del self._session_auth_binding[old_mcp_session_id]
                         logger.debug(
-                            f"Removed stale auth binding: {old_mcp_session_id}"
+                            "Removed stale auth binding: %s", old_mcp_session_id
                         )
                 # Remove old OAuth session binding if it differs from new one
                 if old_session_id and old_session_id != session_id:
                     if old_session_id in self._session_auth_binding:
                         del self._session_auth_binding[old_session_id]
                         logger.debug(
-                            f"Removed stale OAuth session binding: {old_session_id}"
+                            "Removed stale OAuth session binding: %s", old_session_id
                         )
 
             session_info = {
@@ -653,12 +782,17 @@ class OAuth21SessionStore:
                 if mcp_session_id not in self._session_auth_binding:
                     self._session_auth_binding[mcp_session_id] = user_email
                     logger.info(
-                        f"Created immutable session binding: {mcp_session_id} -> {user_email}"
+                        "Created immutable session binding: %s -> %s",
+                        mcp_session_id,
+                        user_email,
                     )
                 elif self._session_auth_binding[mcp_session_id] != user_email:
                     # Security: Attempt to bind session to different user
                     logger.error(
-                        f"SECURITY: Attempt to rebind session {mcp_session_id} from {self._session_auth_binding[mcp_session_id]} to {user_email}"
+                        "SECURITY: Attempt to rebind session %s from %s to %s",
+                        mcp_session_id,
+                        self._session_auth_binding[mcp_session_id],
+                        user_email,
                     )
                     raise ValueError(
                         f"Session {mcp_session_id} is already bound to a different user"
@@ -666,11 +800,16 @@ class OAuth21SessionStore:
 
                 self._mcp_session_mapping[mcp_session_id] = user_email
                 logger.info(
-                    f"Stored OAuth 2.1 session for {user_email} (session_id: {session_id}, mcp_session_id: {mcp_session_id})"
+                    "Stored OAuth 2.1 session for %s (session_id: %s, mcp_session_id: %s)",
+                    user_email,
+                    session_id,
+                    mcp_session_id,
                 )
             else:
                 logger.info(
-                    f"Stored OAuth 2.1 session for {user_email} (session_id: {session_id})"
+                    "Stored OAuth 2.1 session for %s (session_id: %s)",
+                    user_email,
+                    session_id,
                 )
 
             # Also create binding for the OAuth session ID
@@ -690,7 +829,7 @@ class OAuth21SessionStore:
         with self._lock:
             session_info = self._sessions.get(user_email)
             if not session_info:
-                logger.debug(f"No OAuth 2.1 session found for {user_email}")
+                logger.debug("No OAuth 2.1 session found for %s", user_email)
                 return None
 
             try:
@@ -705,11 +844,11 @@ class OAuth21SessionStore:
                     expiry=session_info.get("expiry"),
                 )
 
-                logger.debug(f"Retrieved OAuth 2.1 credentials for {user_email}")
+                logger.debug("Retrieved OAuth 2.1 credentials for %s", user_email)
                 return credentials
 
             except Exception as e:
-                logger.error(f"Failed to create credentials for {user_email}: {e}")
+                logger.error("Failed to create credentials for %s: %s", user_email, e)
                 return None
 
     def get_credentials_by_mcp_session(
@@ -728,10 +867,10 @@ class OAuth21SessionStore:
             # Look up user email from MCP session mapping
             user_email = self._mcp_session_mapping.get(mcp_session_id)
             if not user_email:
-                logger.debug(f"No user mapping found for MCP session {mcp_session_id}")
+                logger.debug("No user mapping found for MCP session %s", mcp_session_id)
                 return None
 
-            logger.debug(f"Found user {user_email} for MCP session {mcp_session_id}")
+            logger.debug("Found user %s for MCP session %s", user_email, mcp_session_id)
             return self.get_credentials(user_email)
 
     def get_credentials_with_validation(
@@ -760,8 +899,9 @@ class OAuth21SessionStore:
             if auth_token_email:
                 if auth_token_email != requested_user_email:
                     logger.error(
-                        f"SECURITY VIOLATION: Token for {auth_token_email} attempted to access "
-                        f"credentials for {requested_user_email}"
+                        "SECURITY VIOLATION: Token for %s attempted to access credentials for %s",
+                        auth_token_email,
+                        requested_user_email,
                     )
                     return None
                 # Token email matches, allow access
@@ -773,8 +913,10 @@ class OAuth21SessionStore:
                 if bound_user:
                     if bound_user != requested_user_email:
                         logger.error(
-                            f"SECURITY VIOLATION: Session {session_id} (bound to {bound_user}) "
-                            f"attempted to access credentials for {requested_user_email}"
+                            "SECURITY VIOLATION: Session %s (bound to %s) attempted to access credentials for %s",
+                            session_id,
+                            bound_user,
+                            requested_user_email,
                         )
                         return None
                     # Session binding matches, allow access
@@ -785,8 +927,10 @@ class OAuth21SessionStore:
                 if mcp_user:
                     if mcp_user != requested_user_email:
                         logger.error(
-                            f"SECURITY VIOLATION: MCP session {session_id} (user {mcp_user}) "
-                            f"attempted to access credentials for {requested_user_email}"
+                            "SECURITY VIOLATION: MCP session %s (user %s) attempted to access credentials for %s",
+                            session_id,
+                            mcp_user,
+                            requested_user_email,
                         )
                         return None
                     # MCP session matches, allow access
@@ -802,23 +946,24 @@ class OAuth21SessionStore:
                     transport_mode = get_transport_mode()
                     if transport_mode != "stdio":
                         logger.error(
-                            f"SECURITY: Attempted to use allow_recent_auth in {transport_mode} mode. "
-                            f"This is only allowed in stdio mode!"
+                            "SECURITY: Attempted to use allow_recent_auth in %s mode. This is only allowed in stdio mode!",
+                            transport_mode,
                         )
                         return None
                 except Exception as e:
-                    logger.error(f"Failed to check transport mode: {e}")
+                    logger.error("Failed to check transport mode: %s", e)
                     return None
 
                 logger.info(
-                    f"Allowing credential access for {requested_user_email} based on recent authentication "
-                    f"(stdio mode only - client not sending bearer token)"
+                    "Allowing credential access for %s based on recent authentication (stdio mode only - client not sending bearer token)",
+                    requested_user_email,
                 )
                 return self.get_credentials(requested_user_email)
 
             # No session or token info available - deny access for security
             logger.warning(
-                f"Credential access denied for {requested_user_email}: No valid session or token"
+                "Credential access denied for %s: No valid session or token",
+                requested_user_email,
             )
             return None
 
@@ -867,7 +1012,9 @@ class OAuth21SessionStore:
                     if mcp_session_id in self._session_auth_binding:
                         del self._session_auth_binding[mcp_session_id]
                     logger.info(
-                        f"Removed OAuth 2.1 session for {user_email} and MCP mapping for {mcp_session_id}"
+                        "Removed OAuth 2.1 session for %s and MCP mapping for %s",
+                        user_email,
+                        mcp_session_id,
                     )
 
                 # Remove OAuth session binding if exists
@@ -875,7 +1022,7 @@ class OAuth21SessionStore:
                     del self._session_auth_binding[session_id]
 
                 if not mcp_session_id:
-                    logger.info(f"Removed OAuth 2.1 session for {user_email}")
+                    logger.info("Removed OAuth 2.1 session for %s", user_email)
 
             # Clean up any orphaned mappings that may have accumulated
             self._cleanup_orphaned_mappings_locked()
@@ -943,7 +1090,7 @@ class OAuth21SessionStore:
         for sid in orphaned_mcp:
             del self._mcp_session_mapping[sid]
             removed += 1
-            logger.debug(f"Removed orphaned MCP session mapping: {sid}")
+            logger.debug("Removed orphaned MCP session mapping: %s", sid)
 
         # Remove orphaned auth bindings
         valid_bindings = valid_session_ids | valid_mcp_session_ids
@@ -953,10 +1100,10 @@ class OAuth21SessionStore:
         for sid in orphaned_bindings:
             del self._session_auth_binding[sid]
             removed += 1
-            logger.debug(f"Removed orphaned auth binding: {sid}")
+            logger.debug("Removed orphaned auth binding: %s", sid)
 
         if removed > 0:
-            logger.info(f"Cleaned up {removed} orphaned session mappings/bindings")
+            logger.info("Cleaned up %s orphaned session mappings/bindings", removed)
 
         return removed
 
@@ -1014,7 +1161,7 @@ def _resolve_client_credentials() -> Tuple[Optional[str], Optional[str]]:
                     client_secret = secret_obj.get_secret_value()  # type: ignore[call-arg]
                 except Exception as exc:  # pragma: no cover - defensive
                     logger.debug(
-                        f"Failed to resolve client secret from provider: {exc}"
+                        "Failed to resolve client secret from provider: %s", exc
                     )
             elif isinstance(secret_obj, str):
                 client_secret = secret_obj
@@ -1027,7 +1174,7 @@ def _resolve_client_credentials() -> Tuple[Optional[str], Optional[str]]:
             client_id = client_id or cfg.client_id
             client_secret = client_secret or cfg.client_secret
         except Exception as exc:  # pragma: no cover - defensive
-            logger.debug(f"Failed to resolve client credentials from config: {exc}")
+            logger.debug("Failed to resolve client credentials from config: %s", exc)
 
     return client_id, client_secret
 
@@ -1135,7 +1282,7 @@ def ensure_session_from_access_token(
                 issuer="https://accounts.google.com",
             )
         except Exception as exc:  # pragma: no cover - defensive
-            logger.debug(f"Failed to cache credentials for {email}: {exc}")
+            logger.debug("Failed to cache credentials for %s: %s", email, exc)
 
     return credentials
 
@@ -1160,7 +1307,7 @@ def get_credentials_from_token(
         if user_email:
             credentials = store.get_credentials(user_email)
             if credentials and credentials.token == access_token:
-                logger.debug(f"Found matching credentials from store for {user_email}")
+                logger.debug("Found matching credentials from store for %s", user_email)
                 return credentials
 
         # If the FastMCP provider is managing tokens, sync from provider storage
@@ -1193,7 +1340,7 @@ def get_credentials_from_token(
         return credentials
 
     except Exception as e:
-        logger.error(f"Failed to create Google credentials from token: {e}")
+        logger.error("Failed to create Google credentials from token: %s", e)
         return None
 
 
@@ -1224,10 +1371,10 @@ def store_token_session(
                 mcp_session_id = get_fastmcp_session_id()
                 if mcp_session_id:
                     logger.debug(
-                        f"Got FastMCP session ID from context: {mcp_session_id}"
+                        "Got FastMCP session ID from context: %s", mcp_session_id
                     )
             except Exception as e:
-                logger.debug(f"Could not get FastMCP session from context: {e}")
+                logger.debug("Could not get FastMCP session from context: %s", e)
 
         # Store session in OAuth21SessionStore
         store = get_oauth21_session_store()
@@ -1256,13 +1403,15 @@ def store_token_session(
 
         if mcp_session_id:
             logger.info(
-                f"Stored token session for {user_email} with MCP session {mcp_session_id}"
+                "Stored token session for %s with MCP session %s",
+                user_email,
+                mcp_session_id,
             )
         else:
-            logger.info(f"Stored token session for {user_email}")
+            logger.info("Stored token session for %s", user_email)
 
         return session_id
 
     except Exception as e:
-        logger.error(f"Failed to store token session: {e}")
+        logger.error("Failed to store token session: %s", e)
         return ""
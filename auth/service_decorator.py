@@ -27,6 +27,7 @@ from auth.oauth_config import (
     is_service_account_enabled,
 )
 from core.context import set_fastmcp_session_id
+from core.api_json import get_api_json_model
 from auth.scopes import (
     GMAIL_READONLY_SCOPE,
     GMAIL_SEND_SCOPE,
@@ -297,7 +298,12 @@ async def _authenticate_service(
             target_email = canonical_email
 
         credentials = _get_service_account_credentials(resolved_scopes, target_email)
-        service = build(service_name, service_version, credentials=credentials)
+        service = build(
+            service_name,
+            service_version,
+            credentials=credentials,
+            model=get_api_json_model(),
+        )
         logger.info(
             f"[{tool_name}] Authenticated {service_name} for "
             f"{target_email} via service-account"
@@ -382,7 +388,9 @@ async def get_authenticated_google_service_oauth21(
                 f"OAuth credentials lack required scopes. Need: {required_scopes}, Have: {sorted(scopes_available)}"
             )
 
-        service = build(service_name, version, credentials=credentials)
+        service = build(
+            service_name, version, credentials=credentials, model=get_api_json_model()
+        )
         logger.info(
             f"[{tool_name}] Authenticated {service_name} for "
             f"{resolved_email} via oauth2.1"
@@ -415,7 +423,9 @@ async def get_authenticated_google_service_oauth21(
             f"OAuth 2.1 credentials lack required scopes. Need: {required_scopes}, Have: {sorted(scopes_available)}"
         )
 
-    service = build(service_name, version, credentials=credentials)
+    service = build(
+        service_name, version, credentials=credentials, model=get_api_json_model()
+    )
     logger.info(
         f"[{tool_name}] Authenticated {service_name} for "
         f"{user_google_email} via oauth2.1"
@@ -0,0 +1,59 @@
+"""JSON body model for Google API discovery clients.
+
+googleapiclient encodes request bodies and decodes responses with the stdlib
+``json`` module. When ``orjson`` is installed, services built with
+``model=get_api_json_model()`` use it instead; large Docs/Sheets batchUpdate
+payloads and document reads are where this shows up.
+"""
+
+from typing import Any, Optional
+
+from googleapiclient.model import JsonModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+class OrjsonJsonModel(JsonModel):
+    """JsonModel that serializes and parses bodies with orjson.
+
+    Anything orjson refuses (non-string keys, oversized ints) or would encode
+    as non-ASCII falls back to the stdlib path, so the wire format
+    matches the default model.
+    """
+
+    def serialize(self, body_value: Any) -> str:
+        if (
+            isinstance(body_value, dict)
+            and "data" not in body_value
+            and self._data_wrapper
+        ):
+            body_value = {"data": body_value}
+        try:
+            encoded = orjson.dumps(body_value)
+        except TypeError:
+            return super().serialize(body_value)
+        # orjson emits raw UTF-8, while httplib2 and batch requests expect the
+        # ASCII-only body json.dumps produces; hand non-ASCII bodies back to it.
+        if not encoded.isascii():
+            return super().serialize(body_value)
+        return encoded.decode("ascii")
+
+    def deserialize(self, content: Any) -> Any:
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+_API_JSON_MODEL = OrjsonJsonModel() if orjson is not None else None
+
+
+def get_api_json_model() -> Optional[JsonModel]:
+    """Return the shared orjson model, or None to keep googleapiclient's default."""
+    return _API_JSON_MODEL
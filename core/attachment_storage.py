@@ -9,6 +9,7 @@ import base64
 import logging
 import os
 import re
+import threading
 import unicodedata
 import uuid
 from pathlib import Path
@@ -266,13 +267,16 @@ class AttachmentStorage:
 
 # Global instance
 _attachment_storage: Optional[AttachmentStorage] = None
+_attachment_storage_lock = threading.Lock()
 
 
 def get_attachment_storage() -> AttachmentStorage:
     """Get the global attachment storage instance."""
     global _attachment_storage
     if _attachment_storage is None:
-        _attachment_storage = AttachmentStorage()
+        with _attachment_storage_lock:
+            if _attachment_storage is None:
+                _attachment_storage = AttachmentStorage()
     return _attachment_storage
 
 
@@ -6,10 +6,12 @@ import os
 import zipfile
 import ssl
 import asyncio
+import contextvars
 import functools
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Annotated, Any, List, Optional
+from typing import Annotated, Any, Callable, List, Optional, TypeVar
 
 from pydantic import BeforeValidator
 from defusedxml import ElementTree as ET
@@ -22,8 +24,49 @@ from auth.oauth_config import is_oauth21_enabled, is_external_oauth21_provider
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 GOOGLE_API_WRITE_RETRIES = 3
 
+_DEFAULT_GOOGLE_IO_WORKERS = 16
+
+
+def _get_google_io_workers() -> int:
+    """Parse WORKSPACE_MCP_GOOGLE_IO_WORKERS with fallback to the default."""
+    raw = os.getenv("WORKSPACE_MCP_GOOGLE_IO_WORKERS", "")
+    if not raw:
+        return _DEFAULT_GOOGLE_IO_WORKERS
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning(
+            "Invalid WORKSPACE_MCP_GOOGLE_IO_WORKERS=%r, falling back to %d",
+            raw,
+            _DEFAULT_GOOGLE_IO_WORKERS,
+        )
+        return _DEFAULT_GOOGLE_IO_WORKERS
+    return max(1, value)
+
+
+# Blocking googleapiclient calls run on their own bounded pool so a burst of
+# tool calls cannot monopolise the event loop's default executor.
+GOOGLE_IO_WORKERS = _get_google_io_workers()
+_google_io_executor = ThreadPoolExecutor(
+    max_workers=GOOGLE_IO_WORKERS, thread_name_prefix="google-io"
+)
+
+
+async def run_google_io(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking Google API call on the shared Google I/O thread pool.
+
+    Drop-in replacement for asyncio.to_thread: context variables are propagated
+    to the worker thread the same way.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await loop.run_in_executor(_google_io_executor, call)
+
 
 class TransientNetworkError(Exception):
     """Custom exception for transient network errors after retries."""
@@ -311,10 +354,14 @@ def extract_office_xml_text(file_bytes: bytes, mime_type: str) -> Optional[str]:
     """
     Very light-weight XML scraper for Word, Excel, PowerPoint files.
     Returns plain-text if something readable is found, else None.
-    Uses zipfile + defusedxml.ElementTree.
+    Uses zipfile + defusedxml.ElementTree.iterparse, streaming each XML member.
     """
     shared_strings: List[str] = []
     ns_excel_main = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+    si_tag = f"{{{ns_excel_main}}}si"
+    t_tag = f"{{{ns_excel_main}}}t"
+    c_tag = f"{{{ns_excel_main}}}c"
+    v_tag = f"{{{ns_excel_main}}}v"
 
     try:
         with zipfile.ZipFile(io.BytesIO(file_bytes)) as zf:
@@ -341,17 +388,19 @@ def extract_office_xml_text(file_bytes: bytes, mime_type: str) -> Optional[str]:
                 ]
                 # Attempt to parse sharedStrings.xml for Excel files
                 try:
-                    shared_strings_xml = zf.read("xl/sharedStrings.xml")
-                    shared_strings_root = ET.fromstring(shared_strings_xml)
-                    for si_element in shared_strings_root.findall(
-                        f"{{{ns_excel_main}}}si"
-                    ):
-                        text_parts = []
-                        # Find all <t> elements, simple or within <r> runs, and concatenate their text
-                        for t_element in si_element.findall(f".//{{{ns_excel_main}}}t"):
-                            if t_element.text:
-                                text_parts.append(t_element.text)
-                        shared_strings.append("".join(text_parts))
+                    with zf.open("xl/sharedStrings.xml") as shared_strings_xml:
+                        for _, si_element in ET.iterparse(shared_strings_xml):
+                            if si_element.tag != si_tag:
+                                continue
+                            # Find all <t> elements, simple or within <r> runs, and concatenate their text
+                            shared_strings.append(
+                                "".join(
+                                    t_element.text
+                                    for t_element in si_element.iter(t_tag)
+                                    if t_element.text
+                                )
+                            )
+                            si_element.clear()
                 except KeyError:
                     logger.info(
                         "No sharedStrings.xml found in Excel file (this is optional)."
@@ -371,53 +420,57 @@ def extract_office_xml_text(file_bytes: bytes, mime_type: str) -> Optional[str]:
             pieces: List[str] = []
             for member in targets:
                 try:
-                    xml_content = zf.read(member)
-                    xml_root = ET.fromstring(xml_content)
                     member_texts: List[str] = []
 
-                    if (
-                        mime_type
-                        == "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                    ):
-                        for cell_element in xml_root.findall(
-                            f".//{{{ns_excel_main}}}c"
-                        ):  # Find all <c> elements
-                            value_element = cell_element.find(
-                                f"{{{ns_excel_main}}}v"
-                            )  # Find <v> under <c>
-
-                            # Skip if cell has no value element or value element has no text
-                            if value_element is None or value_element.text is None:
-                                continue
-
-                            cell_type = cell_element.get("t")
-                            if cell_type == "s":  # Shared string
-                                try:
-                                    ss_idx = int(value_element.text)
-                                    if 0 <= ss_idx < len(shared_strings):
-                                        member_texts.append(shared_strings[ss_idx])
-                                    else:
+                    # Stream each member with iterparse and clear elements once
+                    # they have been read, so the full XML tree is never built.
+                    with zf.open(member) as xml_content:
+                        if (
+                            mime_type
+                            == "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                        ):
+                            for _, cell_element in ET.iterparse(xml_content):
+                                if cell_element.tag != c_tag:
+                                    continue
+                                value_element = cell_element.find(
+                                    v_tag
+                                )  # Find <v> under <c>
+
+                                # Skip if cell has no value element or value element has no text
+                                if value_element is None or value_element.text is None:
+                                    cell_element.clear()
+                                    continue
+
+                                cell_type = cell_element.get("t")
+                                if cell_type == "s":  # Shared string
+                                    try:
+                                        ss_idx = int(value_element.text)
+                                        if 0 <= ss_idx < len(shared_strings):
+                                            member_texts.append(shared_strings[ss_idx])
+                                        else:
+                                            logger.warning(
+                                                f"Invalid shared string index {ss_idx} in {member}. Max index: {len(shared_strings) - 1}"
+                                            )
+                                    except ValueError:
                                         logger.warning(
-                                            f"Invalid shared string index {ss_idx} in {member}. Max index: {len(shared_strings) - 1}"
+                                            f"Non-integer shared string index: '{value_element.text}' in {member}."
                                         )
-                                except ValueError:
-                                    logger.warning(
-                                        f"Non-integer shared string index: '{value_element.text}' in {member}."
-                                    )
-                            else:  # Direct value (number, boolean, inline string if not 's')
-                                member_texts.append(value_element.text)
-                    else:  # Word or PowerPoint
-                        for elem in xml_root.iter():
-                            # For Word: <w:t> where w is "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-                            # For PowerPoint: <a:t> where a is "http://schemas.openxmlformats.org/drawingml/2006/main"
-                            if (
-                                elem.tag.endswith("}t") and elem.text
-                            ):  # Check for any namespaced tag ending with 't'
-                                cleaned_text = elem.text.strip()
+                                else:  # Direct value (number, boolean, inline string if not 's')
+                                    member_texts.append(value_element.text)
+                                cell_element.clear()
+                        else:  # Word or PowerPoint
+                            for _, elem in ET.iterparse(xml_content):
+                                # For Word: <w:t> where w is "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+                                # For PowerPoint: <a:t> where a is "http://schemas.openxmlformats.org/drawingml/2006/main"
                                 if (
-                                    cleaned_text
-                                ):  # Add only if there's non-whitespace text
-                                    member_texts.append(cleaned_text)
+                                    elem.tag.endswith("}t") and elem.text
+                                ):  # Check for any namespaced tag ending with 't'
+                                    cleaned_text = elem.text.strip()
+                                    if (
+                                        cleaned_text
+                                    ):  # Add only if there's non-whitespace text
+                                        member_texts.append(cleaned_text)
+                                elem.clear()
 
                     if member_texts:
                         pieces.append(
@@ -817,6 +817,43 @@ def create_format_text_request(
     }
 
 
+# Text style parameters in the order they are reported, with display labels
+TEXT_FORMAT_LABELS = (
+    ("bold", "bold"),
+    ("italic", "italic"),
+    ("underline", "underline"),
+    ("strikethrough", "strikethrough"),
+    ("font_size", "font size"),
+    ("font_family", "font family"),
+    ("font_weight", "font weight"),
+    ("text_color", "text color"),
+    ("background_color", "background color"),
+    ("link_url", "link"),
+    ("clear_link", "clear link"),
+    ("baseline_offset", "baseline offset"),
+    ("small_caps", "small caps"),
+)
+_TEXT_FORMAT_UNITS = {"font_size": "pt", "font_weight": "w"}
+
+
+def describe_text_format(options: Dict[str, Any]) -> str:
+    """
+    Describe the text style options that are set, e.g. "bold: True, font size: 12pt".
+
+    Args:
+        options: Mapping of text style parameter names (as accepted by
+            create_format_text_request) to values; None values are skipped
+
+    Returns:
+        Comma-separated description of the provided options
+    """
+    return ", ".join(
+        f"{label}: {options[param]}{_TEXT_FORMAT_UNITS.get(param, '')}"
+        for param, label in TEXT_FORMAT_LABELS
+        if options.get(param) is not None
+    )
+
+
 def create_update_paragraph_style_request(
     start_index: int,
     end_index: int,
@@ -1664,6 +1701,61 @@ def create_update_table_column_properties_request(
     }
 
 
+# Required fields for each batch operation type
+OPERATION_REQUIRED_FIELDS = {
+    "insert_text": ["text"],
+    "delete_text": ["start_index", "end_index"],
+    "replace_text": ["start_index", "end_index", "text"],
+    "format_text": ["start_index", "end_index"],
+    "update_paragraph_style": ["start_index", "end_index"],
+    "update_table_cell_style": ["table_start_index"],
+    "insert_table": ["rows", "columns"],
+    "insert_page_break": [],
+    "insert_section_break": [],
+    "find_replace": ["find_text", "replace_text"],
+    "create_bullet_list": ["start_index", "end_index"],
+    "create_named_range": ["name", "start_index", "end_index"],
+    "replace_named_range_content": ["text"],
+    "delete_named_range": [],
+    "update_document_style": [],
+    "update_section_style": ["start_index", "end_index"],
+    "create_header_footer": ["section_type"],
+    "insert_image": ["image_uri"],
+    "insert_doc_tab": ["title", "index"],
+    "delete_doc_tab": ["tab_id"],
+    "update_doc_tab": ["tab_id", "title"],
+    "insert_table_row": ["table_start_index", "row_index"],
+    "delete_table_row": ["table_start_index", "row_index"],
+    "insert_table_column": ["table_start_index", "column_index"],
+    "delete_table_column": ["table_start_index", "column_index"],
+    "merge_table_cells": [
+        "table_start_index",
+        "row_index",
+        "column_index",
+        "row_span",
+        "column_span",
+    ],
+    "unmerge_table_cells": [
+        "table_start_index",
+        "row_index",
+        "column_index",
+        "row_span",
+        "column_span",
+    ],
+    "update_table_column_properties": ["table_start_index", "column_indices"],
+}
+# Insert operations that need either an index or end_of_segment=true
+_POSITIONED_INSERT_OPERATIONS = frozenset(
+    {
+        "insert_text",
+        "insert_table",
+        "insert_page_break",
+        "insert_section_break",
+        "insert_image",
+    }
+)
+
+
 def validate_operation(operation: Dict[str, Any]) -> tuple[bool, str]:
     """
     Validate a batch operation dictionary.
@@ -1678,64 +1770,14 @@ def validate_operation(operation: Dict[str, Any]) -> tuple[bool, str]:
     if not op_type:
         return False, "Missing 'type' field"
 
-    # Validate required fields for each operation type
-    required_fields = {
-        "insert_text": ["text"],
-        "delete_text": ["start_index", "end_index"],
-        "replace_text": ["start_index", "end_index", "text"],
-        "format_text": ["start_index", "end_index"],
-        "update_paragraph_style": ["start_index", "end_index"],
-        "update_table_cell_style": ["table_start_index"],
-        "insert_table": ["rows", "columns"],
-        "insert_page_break": [],
-        "insert_section_break": [],
-        "find_replace": ["find_text", "replace_text"],
-        "create_bullet_list": ["start_index", "end_index"],
-        "create_named_range": ["name", "start_index", "end_index"],
-        "replace_named_range_content": ["text"],
-        "delete_named_range": [],
-        "update_document_style": [],
-        "update_section_style": ["start_index", "end_index"],
-        "create_header_footer": ["section_type"],
-        "insert_image": ["image_uri"],
-        "insert_doc_tab": ["title", "index"],
-        "delete_doc_tab": ["tab_id"],
-        "update_doc_tab": ["tab_id", "title"],
-        "insert_table_row": ["table_start_index", "row_index"],
-        "delete_table_row": ["table_start_index", "row_index"],
-        "insert_table_column": ["table_start_index", "column_index"],
-        "delete_table_column": ["table_start_index", "column_index"],
-        "merge_table_cells": [
-            "table_start_index",
-            "row_index",
-            "column_index",
-            "row_span",
-            "column_span",
-        ],
-        "unmerge_table_cells": [
-            "table_start_index",
-            "row_index",
-            "column_index",
-            "row_span",
-            "column_span",
-        ],
-        "update_table_column_properties": ["table_start_index", "column_indices"],
-    }
-
-    if op_type not in required_fields:
+    if op_type not in OPERATION_REQUIRED_FIELDS:
         return False, f"Unsupported operation type: {op_type or 'None'}"
 
-    for field in required_fields[op_type]:
+    for field in OPERATION_REQUIRED_FIELDS[op_type]:
         if field not in operation:
             return False, f"Missing required field: {field}"
 
-    if op_type in {
-        "insert_text",
-        "insert_table",
-        "insert_page_break",
-        "insert_section_break",
-        "insert_image",
-    }:
+    if op_type in _POSITIONED_INSERT_OPERATIONS:
         end_of_segment = operation.get("end_of_segment", False)
         if end_of_segment and "index" in operation:
             return (
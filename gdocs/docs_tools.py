@@ -8,8 +8,10 @@ import logging
 import asyncio
 import io
 import inspect
+import itertools
 import re
-from typing import List, Any, Literal, Optional, Union
+from collections import OrderedDict
+from typing import Iterator, List, Any, Literal, Optional, Union
 
 from typing_extensions import TypedDict
 
@@ -24,9 +26,15 @@ from core.utils import (
     GOOGLE_API_WRITE_RETRIES,
     extract_office_xml_text,
     handle_http_errors,
+    run_google_io,
     UserInputError,
 )
 from core.server import server
+from gdrive.drive_helpers import (
+    check_public_link_permission,
+    escape_drive_query_value,
+    format_public_sharing_error,
+)
 from core.comments import create_comment_tools
 
 # Import helper functions for document operations
@@ -44,6 +52,7 @@ from gdocs.docs_helpers import (
     create_delete_doc_tab_request,
     validate_suggestions_view_mode,
     create_update_paragraph_style_request,
+    describe_text_format,
 )
 
 # Import document structure and table utilities
@@ -73,6 +82,141 @@ import json
 
 logger = logging.getLogger(__name__)
 HEADER_FOOTER_RUNTIME_CANARY = "docs-hf-canary-20260328b"
+# Bound str.format so tools build the edit link without re-parsing a template
+_DOC_EDIT_URL = "https://docs.google.com/document/d/{}/edit".format
+# Shared tail of the Drive search queries that list native Google Docs
+_DOC_MIME_QUERY_TAIL = (
+    " and mimeType='application/vnd.google-apps.document' and trashed=false"
+)
+
+
+TAB_HEADER_FORMAT = "\n--- TAB: {tab_name} (ID: {tab_id}) ---\n"
+# Tables nested deeper than this are skipped when extracting plain text
+MAX_TABLE_NESTING_DEPTH = 5
+# Text extracted from downloaded (non-native) files, keyed by (file ID, Drive
+# version). Native Docs are not cached: their body depends on the caller's
+# access and suggestions view, and is already fetched in parallel.
+DOC_TEXT_CACHE_SIZE = 32
+_doc_text_cache: "OrderedDict[tuple, str]" = OrderedDict()
+# Upper bound on documents per update_doc_headers_footers_batch call
+MAX_HEADER_FOOTER_BATCH_DOCUMENTS = 100
+# Partial-response masks for documents().get calls that only need text or
+# end indices. Child tabs are requested whole because masks cannot recurse.
+_TEXT_CONTENT_FIELDS = (
+    "content(paragraph/elements/textRun/content,table/tableRows/tableCells/content)"
+)
+_DOC_TEXT_FIELDS = (
+    f"body/{_TEXT_CONTENT_FIELDS},"
+    f"tabs(tabProperties(tabId,title),documentTab/body/{_TEXT_CONTENT_FIELDS},"
+    "childTabs)"
+)
+_TAB_END_INDEX_FIELDS = (
+    "tabs(tabProperties/tabId,documentTab/body/content(endIndex),childTabs)"
+)
+
+
+def _create_doc_with_content(service: Any, title: str, content: str) -> dict:
+    """Create a Doc and insert its initial text in one worker-thread call.
+
+    The insert needs the new document ID, so the two requests stay sequential.
+    """
+    documents = service.documents()
+    doc = documents.create(body={"title": title}).execute()
+    if content:
+        requests = [{"insertText": {"location": {"index": 1}, "text": content}}]
+        documents.batchUpdate(
+            documentId=doc.get("documentId"), body={"requests": requests}
+        ).execute()
+    return doc
+
+
+def _iter_element_text(elements: list) -> Iterator[str]:
+    """Yield the non-blank paragraph lines of Docs body elements, including table cells.
+
+    Nested tables are walked with an explicit stack of element iterators rather
+    than recursion, so no intermediate strings are built per cell or table.
+    """
+    stack = [(iter(elements), 0)]
+    while stack:
+        element_iter, depth = stack[-1]
+        for element in element_iter:
+            paragraph = element.get("paragraph")
+            if paragraph is not None:
+                parts = []
+                for pe in paragraph.get("elements", ()):
+                    text_run = pe.get("textRun")
+                    if text_run and "content" in text_run:
+                        parts.append(text_run["content"])
+                line = "".join(parts)
+                if line and not line.isspace():
+                    yield line
+                continue
+            table = element.get("table")
+            if table is not None and depth < MAX_TABLE_NESTING_DEPTH:
+                cell_elements = itertools.chain.from_iterable(
+                    cell.get("content", ())
+                    for row in table.get("tableRows", ())
+                    for cell in row.get("tableCells", ())
+                )
+                stack.append((cell_elements, depth + 1))
+                break
+        else:
+            stack.pop()
+
+
+def _iter_tab_text(tabs: list) -> Iterator[str]:
+    """Yield text fragments for tabs and their child tabs in document order.
+
+    The tab tree is walked depth-first with an explicit stack, so deeply nested
+    child tabs do not add Python call frames.
+    """
+    stack = [(tab, 0) for tab in reversed(tabs)]
+    while stack:
+        tab, level = stack.pop()
+        if "documentTab" in tab:
+            props = tab.get("tabProperties", {})
+            tab_title = props.get("title", "Untitled Tab")
+            tab_id = props.get("tabId", "Unknown ID")
+            if level > 0:
+                tab_title = "    " * level + f"{tab_title}"
+            if tab_title:
+                yield TAB_HEADER_FORMAT.format(tab_name=tab_title, tab_id=tab_id)
+            tab_body = tab.get("documentTab", {}).get("body", {}).get("content", [])
+            yield from _iter_element_text(tab_body)
+
+        stack.extend((child, level + 1) for child in reversed(tab.get("childTabs", [])))
+
+
+def _doc_text_cache_get(key: Optional[tuple]) -> Optional[str]:
+    """Return cached get_doc_content text for key, refreshing its LRU position."""
+    if key is None:
+        return None
+    text = _doc_text_cache.get(key)
+    if text is not None:
+        _doc_text_cache.move_to_end(key)
+    return text
+
+
+def _doc_text_cache_put(key: Optional[tuple], text: str) -> None:
+    """Remember extracted text for key, evicting the least recently used entry."""
+    if key is None:
+        return
+    _doc_text_cache[key] = text
+    _doc_text_cache.move_to_end(key)
+    while len(_doc_text_cache) > DOC_TEXT_CACHE_SIZE:
+        _doc_text_cache.popitem(last=False)
+
+
+def _discard_task(task: asyncio.Task) -> None:
+    """Cancel a speculative task and swallow whatever it ends up raising."""
+    task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+def _iter_doc_text(doc_data: dict) -> Iterator[str]:
+    """Yield plain-text fragments for a document body followed by all of its tabs."""
+    yield from _iter_element_text(doc_data.get("body", {}).get("content", []))
+    yield from _iter_tab_text(doc_data.get("tabs", []))
 
 
 @server.tool(
@@ -98,14 +242,14 @@ async def search_docs(
     Returns:
         str: A formatted list of Google Docs matching the search query.
     """
-    logger.info(f"[search_docs] Email={user_google_email}, Query='{query}'")
+    logger.info("[search_docs] Email=%s, Query='%s'", user_google_email, query)
 
-    escaped_query = query.replace("'", "\\'")
+    escaped_query = escape_drive_query_value(query)
 
-    response = await asyncio.to_thread(
+    response = await run_google_io(
         service.files()
         .list(
-            q=f"name contains '{escaped_query}' and mimeType='application/vnd.google-apps.document' and trashed=false",
+            q=f"name contains '{escaped_query}'" + _DOC_MIME_QUERY_TAIL,
             pageSize=page_size,
             fields="files(id, name, createdTime, modifiedTime, webViewLink)",
             supportsAllDrives=True,
@@ -117,12 +261,10 @@ async def search_docs(
     if not files:
         return f"No Google Docs found matching '{query}'."
 
-    output = [f"Found {len(files)} Google Docs matching '{query}':"]
-    for f in files:
-        output.append(
-            f"- {f['name']} (ID: {f['id']}) Modified: {f.get('modifiedTime')} Link: {f.get('webViewLink')}"
-        )
-    return "\n".join(output)
+    return f"Found {len(files)} Google Docs matching '{query}':\n" + "\n".join(
+        f"- {f['name']} (ID: {f['id']}) Modified: {f.get('modifiedTime')} Link: {f.get('webViewLink')}"
+        for f in files
+    )
 
 
 @server.tool(
@@ -151,6 +293,7 @@ async def get_doc_content(
     user_google_email: str,
     document_id: str,
     suggestions_view_mode: str = "DEFAULT_FOR_CURRENT_ACCESS",
+    include_tabs: bool = True,
 ) -> str:
     """
     Retrieves content of a Google Doc or a Drive file (like .docx) identified by document_id.
@@ -165,6 +308,8 @@ async def get_doc_content(
             - "SUGGESTIONS_INLINE": Suggested changes appear inline in the document
             - "PREVIEW_SUGGESTIONS_ACCEPTED": Preview as if all suggestions were accepted
             - "PREVIEW_WITHOUT_SUGGESTIONS": Preview as if all suggestions were rejected
+        include_tabs: Return every tab with a header per tab (default True). Set False
+            to fetch only the first tab's body, which is a smaller response.
 
     Returns:
         str: The document content with metadata header.
@@ -173,113 +318,75 @@ async def get_doc_content(
     if validation_error:
         return validation_error
     logger.info(
-        f"[get_doc_content] Invoked. Document/File ID: '{document_id}' for user '{user_google_email}'"
+        "[get_doc_content] Invoked. Document/File ID: '%s' for user '%s'",
+        document_id,
+        user_google_email,
     )
 
-    file_metadata = await asyncio.to_thread(
-        drive_service.files()
-        .get(
-            fileId=document_id,
-            fields="id, name, mimeType, webViewLink",
-            supportsAllDrives=True,
-        )
-        .execute
-    )
-    mime_type = file_metadata.get("mimeType", "")
-    file_name = file_metadata.get("name", "Unknown File")
-    web_view_link = file_metadata.get("webViewLink", "#")
+    # Build the files() resource once; it is reused for the media download.
+    drive_files = drive_service.files()
 
-    logger.info(
-        f"[get_doc_content] File '{file_name}' (ID: {document_id}) has mimeType: '{mime_type}'"
+    # Most IDs passed here are native Docs, so fetch the document body in
+    # parallel with the Drive metadata instead of waiting for the mimeType.
+    metadata_task = asyncio.create_task(
+        run_google_io(
+            drive_files.get(
+                fileId=document_id,
+                fields="id, name, mimeType, webViewLink, version",
+                supportsAllDrives=True,
+            ).execute
+        )
     )
-
-    body_text = ""
-
-    if mime_type == "application/vnd.google-apps.document":
-        logger.info("[get_doc_content] Processing as native Google Doc.")
-        doc_data = await asyncio.to_thread(
+    doc_task = asyncio.create_task(
+        run_google_io(
             docs_service.documents()
             .get(
                 documentId=document_id,
-                includeTabsContent=True,
+                includeTabsContent=include_tabs,
                 suggestionsViewMode=suggestions_view_mode,
+                fields=_DOC_TEXT_FIELDS,
             )
             .execute
         )
-        TAB_HEADER_FORMAT = "\n--- TAB: {tab_name} (ID: {tab_id}) ---\n"
-
-        def extract_text_from_elements(elements, tab_name=None, tab_id=None, depth=0):
-            """Extract text from document elements (paragraphs, tables, etc.)"""
-            if depth > 5:
-                return ""
-            text_lines = []
-            if tab_name:
-                text_lines.append(
-                    TAB_HEADER_FORMAT.format(tab_name=tab_name, tab_id=tab_id)
-                )
-
-            for element in elements:
-                if "paragraph" in element:
-                    paragraph = element.get("paragraph", {})
-                    para_elements = paragraph.get("elements", [])
-                    current_line_text = ""
-                    for pe in para_elements:
-                        text_run = pe.get("textRun", {})
-                        if text_run and "content" in text_run:
-                            current_line_text += text_run["content"]
-                    if current_line_text.strip():
-                        text_lines.append(current_line_text)
-                elif "table" in element:
-                    # Handle table content
-                    table = element.get("table", {})
-                    table_rows = table.get("tableRows", [])
-                    for row in table_rows:
-                        row_cells = row.get("tableCells", [])
-                        for cell in row_cells:
-                            cell_content = cell.get("content", [])
-                            cell_text = extract_text_from_elements(
-                                cell_content, depth=depth + 1
-                            )
-                            if cell_text.strip():
-                                text_lines.append(cell_text)
-            return "".join(text_lines)
-
-        def process_tab_hierarchy(tab, level=0):
-            """Process a tab and its nested child tabs recursively"""
-            tab_text = ""
-
-            if "documentTab" in tab:
-                props = tab.get("tabProperties", {})
-                tab_title = props.get("title", "Untitled Tab")
-                tab_id = props.get("tabId", "Unknown ID")
-                if level > 0:
-                    tab_title = "    " * level + f"{tab_title}"
-                tab_body = tab.get("documentTab", {}).get("body", {}).get("content", [])
-                tab_text += extract_text_from_elements(tab_body, tab_title, tab_id)
-
-            child_tabs = tab.get("childTabs", [])
-            for child_tab in child_tabs:
-                tab_text += process_tab_hierarchy(child_tab, level + 1)
-
-            return tab_text
-
-        processed_text_lines = []
-
-        body_elements = doc_data.get("body", {}).get("content", [])
-        main_content = extract_text_from_elements(body_elements)
-        if main_content.strip():
-            processed_text_lines.append(main_content)
+    )
+    try:
+        file_metadata = await metadata_task
+    except BaseException:
+        _discard_task(doc_task)
+        raise
+    mime_type = file_metadata.get("mimeType", "")
+    file_name = file_metadata.get("name", "Unknown File")
+    web_view_link = file_metadata.get("webViewLink", "#")
 
-        tabs = doc_data.get("tabs", [])
-        for tab in tabs:
-            tab_content = process_tab_hierarchy(tab)
-            if tab_content.strip():
-                processed_text_lines.append(tab_content)
+    logger.info(
+        "[get_doc_content] File '%s' (ID: %s) has mimeType: '%s'",
+        file_name,
+        document_id,
+        mime_type,
+    )
 
-        body_text = "".join(processed_text_lines)
+    body_text = ""
+    is_native_doc = mime_type == "application/vnd.google-apps.document"
+    # Drive bumps version on every change, so (id, version) identifies the
+    # downloaded bytes. The metadata call above has already checked access.
+    version = file_metadata.get("version")
+    cache_key = (document_id, version) if version and not is_native_doc else None
+    cached_text = _doc_text_cache_get(cache_key)
+
+    if cached_text is not None:
+        logger.info("[get_doc_content] Using cached text for version %s.", version)
+        _discard_task(doc_task)
+        body_text = cached_text
+    elif is_native_doc:
+        logger.info("[get_doc_content] Processing as native Google Doc.")
+        doc_data = await doc_task
+        body_text = "".join(_iter_doc_text(doc_data))
     else:
+        # The Docs API rejects non-native files; drop the speculative fetch.
+        _discard_task(doc_task)
         logger.info(
-            f"[get_doc_content] Processing as Drive file (e.g., .docx, other). MimeType: {mime_type}"
+            "[get_doc_content] Processing as Drive file (e.g., .docx, other). MimeType: %s",
+            mime_type,
         )
 
         export_mime_type_map = {
@@ -290,25 +397,18 @@ async def get_doc_content(
         effective_export_mime = export_mime_type_map.get(mime_type)
 
         request_obj = (
-            drive_service.files().export_media(
+            drive_files.export_media(
                 fileId=document_id,
                 mimeType=effective_export_mime,
                 supportsAllDrives=True,
             )
             if effective_export_mime
-            else drive_service.files().get_media(
-                fileId=document_id, supportsAllDrives=True
-            )
+            else drive_files.get_media(fileId=document_id, supportsAllDrives=True)
         )
 
-        fh = io.BytesIO()
-        downloader = MediaIoBaseDownload(fh, request_obj)
-        loop = asyncio.get_event_loop()
-        done = False
-        while not done:
-            status, done = await loop.run_in_executor(None, downloader.next_chunk)
-
-        file_content_bytes = fh.getvalue()
+        # Media requests return the raw body from execute(), so download in one
+        # request instead of polling MediaIoBaseDownload into a BytesIO copy.
+        file_content_bytes = await run_google_io(request_obj.execute)
 
         office_text = extract_office_xml_text(file_content_bytes, mime_type)
         if office_text:
@@ -322,6 +422,9 @@ async def get_doc_content(
                     f"{len(file_content_bytes)} bytes]"
                 )
 
+    if cached_text is None:
+        _doc_text_cache_put(cache_key, body_text)
+
     header = (
         f'File: "{file_name}" (ID: {document_id}, Type: {mime_type})\n'
         f"Link: {web_view_link}\n\n--- CONTENT ---\n"
@@ -350,13 +453,15 @@ async def list_docs_in_folder(
         str: A formatted list of Google Docs in the specified folder.
     """
     logger.info(
-        f"[list_docs_in_folder] Invoked. Email: '{user_google_email}', Folder ID: '{folder_id}'"
+        "[list_docs_in_folder] Invoked. Email: '%s', Folder ID: '%s'",
+        user_google_email,
+        folder_id,
     )
 
-    rsp = await asyncio.to_thread(
+    rsp = await run_google_io(
         service.files()
         .list(
-            q=f"'{folder_id}' in parents and mimeType='application/vnd.google-apps.document' and trashed=false",
+            q=f"'{folder_id}' in parents" + _DOC_MIME_QUERY_TAIL,
             pageSize=page_size,
             fields="files(id, name, modifiedTime, webViewLink)",
             supportsAllDrives=True,
@@ -367,12 +472,10 @@ async def list_docs_in_folder(
     items = rsp.get("files", [])
     if not items:
         return f"No Google Docs found in folder '{folder_id}'."
-    out = [f"Found {len(items)} Docs in folder '{folder_id}':"]
-    for f in items:
-        out.append(
-            f"- {f['name']} (ID: {f['id']}) Modified: {f.get('modifiedTime')} Link: {f.get('webViewLink')}"
-        )
-    return "\n".join(out)
+    return f"Found {len(items)} Docs in folder '{folder_id}':\n" + "\n".join(
+        f"- {f['name']} (ID: {f['id']}) Modified: {f.get('modifiedTime')} Link: {f.get('webViewLink')}"
+        for f in items
+    )
 
 
 @server.tool(
@@ -411,20 +514,13 @@ async def create_doc(
     Returns:
         str: Confirmation message with document ID, link, and initial document state.
     """
-    logger.info(f"[create_doc] Invoked. Email: '{user_google_email}', Title='{title}'")
-
-    doc = await asyncio.to_thread(
-        service.documents().create(body={"title": title}).execute
+    logger.info(
+        "[create_doc] Invoked. Email: '%s', Title='%s'", user_google_email, title
     )
+
+    doc = await run_google_io(_create_doc_with_content, service, title, content)
     doc_id = doc.get("documentId")
-    if content:
-        requests = [{"insertText": {"location": {"index": 1}, "text": content}}]
-        await asyncio.to_thread(
-            service.documents()
-            .batchUpdate(documentId=doc_id, body={"requests": requests})
-            .execute
-        )
-    link = f"https://docs.google.com/document/d/{doc_id}/edit"
+    link = _DOC_EDIT_URL(doc_id)
     if content:
         content_note = f"Initial content: {len(content)} characters inserted."
     else:
@@ -436,7 +532,11 @@ async def create_doc(
         f"Link: {link}"
     )
     logger.info(
-        f"Successfully created Google Doc '{title}' (ID: {doc_id}) for {user_google_email}. Link: {link}"
+        "Successfully created Google Doc '%s' (ID: %s) for %s. Link: %s",
+        title,
+        doc_id,
+        user_google_email,
+        link,
     )
     return msg
 
@@ -515,9 +615,31 @@ async def modify_doc_text(
     Returns:
         str: Confirmation message with operation details
     """
+    formatting = {
+        "bold": bold,
+        "italic": italic,
+        "underline": underline,
+        "strikethrough": strikethrough,
+        "font_size": font_size,
+        "font_family": font_family,
+        "font_weight": font_weight,
+        "text_color": text_color,
+        "background_color": background_color,
+        "link_url": link_url,
+        "clear_link": clear_link,
+        "baseline_offset": baseline_offset,
+        "small_caps": small_caps,
+    }
+    # Computed once; decides validation, request building and logging below
+    has_formatting = any(v is not None for v in formatting.values())
+
     logger.info(
-        f"[modify_doc_text] Doc={document_id}, start={start_index}, end={end_index}, text={text is not None}, "
-        f"formatting={any(p is not None for p in [bold, italic, underline, strikethrough, font_size, font_family, font_weight, text_color, background_color, link_url, clear_link, baseline_offset, small_caps])}"
+        "[modify_doc_text] Doc=%s, start=%s, end=%s, text=%s, formatting=%s",
+        document_id,
+        start_index,
+        end_index,
+        text is not None,
+        has_formatting,
     )
 
     # Input validation
@@ -528,26 +650,11 @@ async def modify_doc_text(
         return f"Error: {error_msg}"
 
     # Validate that we have something to do
-    formatting_params = [
-        bold,
-        italic,
-        underline,
-        strikethrough,
-        font_size,
-        font_family,
-        font_weight,
-        text_color,
-        background_color,
-        link_url,
-        clear_link,
-        baseline_offset,
-        small_caps,
-    ]
-    if text is None and not any(p is not None for p in formatting_params):
+    if text is None and not has_formatting:
         return "Error: Must provide either 'text' to insert/replace, or formatting parameters (bold, italic, underline, strikethrough, font_size, font_family, text_color, background_color, link_url)."
 
     # Validate text formatting params if provided
-    if any(p is not None for p in formatting_params):
+    if has_formatting:
         is_valid, error_msg = validator.validate_text_formatting_params(
             bold,
             italic,
@@ -642,7 +749,7 @@ async def modify_doc_text(
                 operations.append(f"Inserted text at index {start_index}")
 
     # Handle formatting
-    if any(p is not None for p in formatting_params):
+    if has_formatting:
         # Adjust range for formatting based on text operations
         format_start = start_index
         format_end = end_index
@@ -685,32 +792,13 @@ async def modify_doc_text(
             )
         )
 
-        format_details = [
-            f"{name}={value}"
-            for name, value in [
-                ("bold", bold),
-                ("italic", italic),
-                ("underline", underline),
-                ("strikethrough", strikethrough),
-                ("font_size", font_size),
-                ("font_family", font_family),
-                ("font_weight", font_weight),
-                ("text_color", text_color),
-                ("background_color", background_color),
-                ("link_url", link_url),
-                ("clear_link", clear_link),
-                ("baseline_offset", baseline_offset),
-                ("small_caps", small_caps),
-            ]
-            if value is not None
-        ]
-
         operations.append(
-            f"Applied formatting ({', '.join(format_details)}) to range {format_start}-{format_end}"
+            f"Applied formatting ({describe_text_format(formatting)}) "
+            f"to range {format_start}-{format_end}"
         )
 
     try:
-        await asyncio.to_thread(
+        await run_google_io(
             service.documents()
             .batchUpdate(documentId=document_id, body={"requests": requests})
             .execute
@@ -718,7 +806,7 @@ async def modify_doc_text(
     except HttpError as error:
         raise _rewrite_modify_doc_text_http_error(error, segment_id) from error
 
-    link = f"https://docs.google.com/document/d/{document_id}/edit"
+    link = _DOC_EDIT_URL(document_id)
     operation_summary = "; ".join(operations)
     text_info = f" Text length: {len(text)} characters." if text else ""
     return f"{operation_summary} in document {document_id}.{text_info} Link: {link}"
@@ -768,14 +856,18 @@ async def find_and_replace_doc(
         str: Confirmation message with replacement count
     """
     logger.info(
-        f"[find_and_replace_doc] Doc={document_id}, find='{find_text}', replace='{replace_text}', tab='{tab_id}'"
+        "[find_and_replace_doc] Doc=%s, find='%s', replace='%s', tab='%s'",
+        document_id,
+        find_text,
+        replace_text,
+        tab_id,
     )
 
     requests = [
         create_find_replace_request(find_text, replace_text, match_case, tab_id)
     ]
 
-    result = await asyncio.to_thread(
+    result = await run_google_io(
         service.documents()
         .batchUpdate(documentId=document_id, body={"requests": requests})
         .execute
@@ -788,7 +880,7 @@ async def find_and_replace_doc(
         if "replaceAllText" in reply:
             replacements = reply["replaceAllText"].get("occurrencesChanged", 0)
 
-    link = f"https://docs.google.com/document/d/{document_id}/edit"
+    link = _DOC_EDIT_URL(document_id)
     return f"Replaced {replacements} occurrence(s) of '{find_text}' with '{replace_text}' in document {document_id}. Link: {link}"
 
 
@@ -831,7 +923,10 @@ async def insert_doc_elements(
         str: Confirmation message with insertion details
     """
     logger.info(
-        f"[insert_doc_elements] Doc={document_id}, type={element_type}, index={index}"
+        "[insert_doc_elements] Doc=%s, type=%s, index=%s",
+        document_id,
+        element_type,
+        index,
     )
 
     # Handle the special case where we can't insert at the first section break
@@ -872,13 +967,13 @@ async def insert_doc_elements(
     else:
         return f"Error: Unsupported element type '{element_type}'. Supported types: 'table', 'list', 'page_break'."
 
-    await asyncio.to_thread(
+    await run_google_io(
         service.documents()
         .batchUpdate(documentId=document_id, body={"requests": requests})
         .execute
     )
 
-    link = f"https://docs.google.com/document/d/{document_id}/edit"
+    link = _DOC_EDIT_URL(document_id)
     return f"Inserted {description} at index {index} in document {document_id}. Link: {link}"
 
 
@@ -927,7 +1022,10 @@ async def insert_doc_image(
         str: Confirmation message with insertion details
     """
     logger.info(
-        f"[insert_doc_image] Doc={document_id}, source={image_source}, index={index}"
+        "[insert_doc_image] Doc=%s, source=%s, index=%s",
+        document_id,
+        image_source,
+        index,
     )
 
     # Handle the special case where we can't insert at the first section break
@@ -937,18 +1035,16 @@ async def insert_doc_image(
         index = 1
 
     # Determine if source is a Drive file ID or URL
-    is_drive_file = not (
-        image_source.startswith("http://") or image_source.startswith("https://")
-    )
+    is_drive_file = not image_source.startswith(("http://", "https://"))
 
     if is_drive_file:
         # Verify Drive file exists and get metadata
         try:
-            file_metadata = await asyncio.to_thread(
+            file_metadata = await run_google_io(
                 drive_service.files()
                 .get(
                     fileId=image_source,
-                    fields="id, name, mimeType",
+                    fields="id, name, mimeType, permissions, shared",
                     supportsAllDrives=True,
                 )
                 .execute
@@ -956,6 +1052,16 @@ async def insert_doc_image(
             mime_type = file_metadata.get("mimeType", "")
             if not mime_type.startswith("image/"):
                 return f"Error: File {image_source} is not an image (MIME type: {mime_type})."
+            # Docs fetches the image anonymously, so a private file would only
+            # fail inside batchUpdate. Drive omits permissions for callers who
+            # cannot see the ACL; let those through rather than guess.
+            permissions = file_metadata.get("permissions")
+            if permissions is not None and not check_public_link_permission(
+                permissions
+            ):
+                return format_public_sharing_error(
+                    file_metadata.get("name", image_source), image_source
+                )
 
             image_uri = f"https://drive.google.com/uc?id={image_source}"
             source_description = f"Drive file {file_metadata.get('name', image_source)}"
@@ -968,7 +1074,7 @@ async def insert_doc_image(
     # Use helper to create image request
     requests = [create_insert_image_request(index, image_uri, width, height)]
 
-    await asyncio.to_thread(
+    await run_google_io(
         docs_service.documents()
         .batchUpdate(documentId=document_id, body={"requests": requests})
         .execute
@@ -978,7 +1084,7 @@ async def insert_doc_image(
     if width or height:
         size_info = f" (size: {width or 'auto'}x{height or 'auto'} points)"
 
-    link = f"https://docs.google.com/document/d/{document_id}/edit"
+    link = _DOC_EDIT_URL(document_id)
     return f"Inserted {source_description}{size_info} at index {index} in document {document_id}. Link: {link}"
 
 
@@ -1027,7 +1133,9 @@ async def update_doc_headers_footers(
     Returns:
         str: Confirmation message with update details
     """
-    logger.info(f"[update_doc_headers_footers] Doc={document_id}, type={section_type}")
+    logger.info(
+        "[update_doc_headers_footers] Doc=%s, type=%s", document_id, section_type
+    )
 
     # Input validation
     validator = ValidationManager()
@@ -1054,12 +1162,101 @@ async def update_doc_headers_footers(
     )
 
     if success:
-        link = f"https://docs.google.com/document/d/{document_id}/edit"
+        link = _DOC_EDIT_URL(document_id)
         return f"{message}. Runtime: {HEADER_FOOTER_RUNTIME_CANARY}. Link: {link}"
     else:
         return f"Error: {message}. Runtime: {HEADER_FOOTER_RUNTIME_CANARY}"
 
 
+@server.tool(
+    title="Update Doc Headers Footers Batch",
+    annotations=ToolAnnotations(
+        readOnlyHint=False,
+        destructiveHint=True,
+        idempotentHint=False,
+        openWorldHint=True,
+    ),
+)
+@handle_http_errors("update_doc_headers_footers_batch", service_type="docs")
+@require_google_service("docs", "docs_write")
+async def update_doc_headers_footers_batch(
+    service: Any,
+    user_google_email: str,
+    document_ids: List[str],
+    section_type: str,
+    content: str,
+    header_footer_type: str = "DEFAULT",
+) -> str:
+    """
+    Sets the same header/footer text in several Google Docs at once.
+
+    Behaves like update_doc_headers_footers for each document, but reads and
+    writes the documents with batched API requests, so updating many
+    documents costs a few round trips instead of two or more per document.
+    Missing headers/footers are still created automatically.
+
+    Args:
+        user_google_email: User's Google email address
+        document_ids: IDs of the documents to update (max 100)
+        section_type: Type of section to create or update ("header" or "footer")
+        content: Text content for the header/footer
+        header_footer_type: Type of header/footer ("DEFAULT", "FIRST_PAGE_ONLY", "EVEN_PAGE")
+
+    Returns:
+        str: Summary line followed by one result line per document
+    """
+    logger.info(
+        "[update_doc_headers_footers_batch] Docs=%s, type=%s",
+        len(document_ids),
+        section_type,
+    )
+
+    # Input validation
+    validator = ValidationManager()
+
+    if not document_ids:
+        return "Error: document_ids cannot be empty"
+    if len(document_ids) > MAX_HEADER_FOOTER_BATCH_DOCUMENTS:
+        return (
+            f"Error: at most {MAX_HEADER_FOOTER_BATCH_DOCUMENTS} documents can be "
+            f"updated per call, got {len(document_ids)}"
+        )
+
+    for document_id in document_ids:
+        is_valid, error_msg = validator.validate_document_id(document_id)
+        if not is_valid:
+            return f"Error: {error_msg}"
+
+    is_valid, error_msg = validator.validate_header_footer_params(
+        section_type, header_footer_type
+    )
+    if not is_valid:
+        return f"Error: {error_msg}"
+
+    is_valid, error_msg = validator.validate_text_content(content)
+    if not is_valid:
+        return f"Error: {error_msg}"
+
+    header_footer_manager = HeaderFooterManager(service)
+
+    results = await header_footer_manager.update_header_footer_content_batch(
+        document_ids, section_type, content, header_footer_type
+    )
+
+    succeeded = sum(success for success, _ in results.values())
+    lines = [
+        f"Updated {section_type} in {succeeded} of {len(results)} documents. "
+        f"Runtime: {HEADER_FOOTER_RUNTIME_CANARY}."
+    ]
+    lines.extend(
+        f"- {document_id}: {message}"
+        if success
+        else f"- {document_id}: Error: {message}"
+        for document_id, (success, message) in results.items()
+    )
+    return "\n".join(lines)
+
+
 @server.tool(
     title="Batch Update Doc",
     annotations=ToolAnnotations(
@@ -1076,9 +1273,12 @@ async def batch_update_doc(
     user_google_email: str,
     document_id: str,
     operations: BatchDocOperations,
+    preserve_order: bool = True,
 ) -> str:
     """
     Executes multiple low-level document operations in a single atomic batch update.
+    A batch may expand to at most 500 API requests (replace_text counts as two);
+    larger batches are rejected, so split them across several calls.
 
     For normal header/footer text, prefer update_doc_headers_footers.
     Only use create_header_footer here for advanced section-break layouts.
@@ -1140,6 +1340,13 @@ async def batch_update_doc(
         document_id: ID of the document to update
         operations: List of operation dicts. Each operation MUST have a 'type' field.
                     All operations accept an optional 'tab_id' to target a specific tab.
+        preserve_order: Apply operations in the given order (default). Set false
+                        when every index comes from one inspect_doc_structure
+                        snapshot: consecutive insert_text, delete_text,
+                        replace_text, format_text, insert_table and
+                        insert_page_break operations are then applied from the
+                        highest index down, so earlier edits cannot shift later
+                        ones. end_of_segment and other operations keep their place.
 
     Supported operation types and their parameters:
 
@@ -1289,7 +1496,9 @@ async def batch_update_doc(
     ]
 
     logger.debug(
-        f"[batch_update_doc] Doc={document_id}, operations={len(normalized_operations)}"
+        "[batch_update_doc] Doc=%s, operations=%s",
+        document_id,
+        len(normalized_operations),
     )
 
     # Input validation
@@ -1307,11 +1516,11 @@ async def batch_update_doc(
     batch_manager = BatchOperationManager(service)
 
     success, message, metadata = await batch_manager.execute_batch_operations(
-        document_id, normalized_operations
+        document_id, normalized_operations, preserve_order
     )
 
     if success:
-        link = f"https://docs.google.com/document/d/{document_id}/edit"
+        link = _DOC_EDIT_URL(document_id)
         replies_count = metadata.get("replies_count", 0)
         doc_length = metadata.get("document_length")
         length_info = f" Document length: {doc_length}." if doc_length else ""
@@ -1395,11 +1604,14 @@ async def inspect_doc_structure(
         str: JSON string containing document structure and safe insertion indices
     """
     logger.debug(
-        f"[inspect_doc_structure] Doc={document_id}, detailed={detailed}, tab_id={tab_id}"
+        "[inspect_doc_structure] Doc=%s, detailed=%s, tab_id=%s",
+        document_id,
+        detailed,
+        tab_id,
     )
 
     # Get the document
-    doc = await asyncio.to_thread(
+    doc = await run_google_io(
         service.documents().get(documentId=document_id, includeTabsContent=True).execute
     )
 
@@ -1582,7 +1794,7 @@ async def inspect_doc_structure(
     if tab_id:
         result["inspected_tab_id"] = tab_id
 
-    link = f"https://docs.google.com/document/d/{document_id}/edit"
+    link = _DOC_EDIT_URL(document_id)
     return f"Document structure analysis for {document_id}:\n\n{json.dumps(result, indent=2)}\n\nLink: {link}"
 
 
@@ -1772,7 +1984,7 @@ async def create_table_with_data(
     Returns:
         str: Confirmation with table details and link
     """
-    logger.debug(f"[create_table_with_data] Doc={document_id}, index={index}")
+    logger.debug("[create_table_with_data] Doc=%s, index=%s", document_id, index)
 
     # Input validation
     validator = ValidationManager()
@@ -1800,14 +2012,14 @@ async def create_table_with_data(
     # If it failed due to index being at or beyond document end, retry with adjusted index
     if not success and "must be less than the end index" in message:
         logger.debug(
-            f"Index {index} is at document boundary, retrying with index {index - 1}"
+            "Index %s is at document boundary, retrying with index %s", index, index - 1
         )
         success, message, metadata = await table_manager.create_and_populate_table(
             document_id, table_data, index - 1, bold_headers, tab_id
         )
 
     if success:
-        link = f"https://docs.google.com/document/d/{document_id}/edit"
+        link = _DOC_EDIT_URL(document_id)
         rows = metadata.get("rows", 0)
         columns = metadata.get("columns", 0)
 
@@ -1873,13 +2085,11 @@ async def debug_table_structure(
         str: Detailed JSON structure showing table layout, cell positions, and current content
     """
     logger.debug(
-        f"[debug_table_structure] Doc={document_id}, table_index={table_index}"
+        "[debug_table_structure] Doc=%s, table_index=%s", document_id, table_index
     )
 
     # Get the document
-    doc = await asyncio.to_thread(
-        service.documents().get(documentId=document_id).execute
-    )
+    doc = await run_google_io(service.documents().get(documentId=document_id).execute)
 
     # Find tables
     tables = find_tables(doc)
@@ -1909,7 +2119,7 @@ async def debug_table_structure(
             row_info.append(cell_debug)
         debug_info["cells"].append(row_info)
 
-    link = f"https://docs.google.com/document/d/{document_id}/edit"
+    link = _DOC_EDIT_URL(document_id)
     return f"Table structure debug for table {table_index}:\n\n{json.dumps(debug_info, indent=2)}\n\nLink: {link}"
 
 
@@ -1944,12 +2154,16 @@ async def export_doc_to_pdf(
         str: Confirmation message with PDF file details and links
     """
     logger.info(
-        f"[export_doc_to_pdf] Email={user_google_email}, Doc={document_id}, pdf_filename={pdf_filename}, folder_id={folder_id}"
+        "[export_doc_to_pdf] Email=%s, Doc=%s, pdf_filename=%s, folder_id=%s",
+        user_google_email,
+        document_id,
+        pdf_filename,
+        folder_id,
     )
 
     # Get file metadata first to validate it's a Google Doc
     try:
-        file_metadata = await asyncio.to_thread(
+        file_metadata = await run_google_io(
             service.files()
             .get(
                 fileId=document_id,
@@ -1969,7 +2183,7 @@ async def export_doc_to_pdf(
     if mime_type != "application/vnd.google-apps.document":
         return f"Error: File '{original_name}' is not a Google Doc (MIME type: {mime_type}). Only native Google Docs can be exported to PDF."
 
-    logger.info(f"[export_doc_to_pdf] Exporting '{original_name}' to PDF")
+    logger.info("[export_doc_to_pdf] Exporting '%s' to PDF", original_name)
 
     # Export the document as PDF
     try:
@@ -1982,7 +2196,7 @@ async def export_doc_to_pdf(
 
         done = False
         while not done:
-            _, done = await asyncio.to_thread(downloader.next_chunk)
+            _, done = await run_google_io(downloader.next_chunk)
 
         pdf_content = fh.getvalue()
         pdf_size = len(pdf_content)
@@ -2011,7 +2225,7 @@ async def export_doc_to_pdf(
             file_metadata["parents"] = [folder_id]
 
         # Upload the file
-        uploaded_file = await asyncio.to_thread(
+        uploaded_file = await run_google_io(
             service.files()
             .create(
                 body=file_metadata,
@@ -2028,7 +2242,7 @@ async def export_doc_to_pdf(
         pdf_parents = uploaded_file.get("parents", [])
 
         logger.info(
-            f"[export_doc_to_pdf] Successfully uploaded PDF to Drive: {pdf_file_id}"
+            "[export_doc_to_pdf] Successfully uploaded PDF to Drive: %s", pdf_file_id
         )
 
         folder_info = ""
@@ -2054,7 +2268,7 @@ async def _get_paragraph_start_indices_in_range(
     """
     Fetch paragraph start indices that overlap a target range.
     """
-    doc_data = await asyncio.to_thread(
+    doc_data = await run_google_io(
         service.documents()
         .get(
             documentId=document_id,
@@ -2180,7 +2394,10 @@ async def update_paragraph_style(
                                alignment="CENTER", line_spacing=2.0)
     """
     logger.info(
-        f"[update_paragraph_style] Doc={document_id}, Range: {start_index}-{end_index}"
+        "[update_paragraph_style] Doc=%s, Range: %s-%s",
+        document_id,
+        start_index,
+        end_index,
     )
 
     # Validate range
@@ -2293,7 +2510,7 @@ async def update_paragraph_style(
     if not requests:
         return f"No paragraph style changes or list creation specified for document {document_id}"
 
-    await asyncio.to_thread(
+    await run_google_io(
         service.documents()
         .batchUpdate(documentId=document_id, body={"requests": requests})
         .execute
@@ -2337,7 +2554,7 @@ async def update_paragraph_style(
             list_desc += f" using {bullet_preset}"
         summary_parts.append(list_desc)
 
-    link = f"https://docs.google.com/document/d/{document_id}/edit"
+    link = _DOC_EDIT_URL(document_id)
     return f"Applied paragraph formatting ({', '.join(summary_parts)}) to range {start_index}-{end_index} in document {document_id}. Link: {link}"
 
 
@@ -2413,13 +2630,16 @@ async def get_doc_as_markdown(
         return validation_error
 
     logger.info(
-        f"[get_doc_as_markdown] Doc={document_id}, comments={include_comments}, mode={comment_mode}"
+        "[get_doc_as_markdown] Doc=%s, comments=%s, mode=%s",
+        document_id,
+        include_comments,
+        comment_mode,
     )
 
     # Fetch document content via Docs API (includeTabsContent for multi-tab docs)
     try:
         doc = await asyncio.wait_for(
-            asyncio.to_thread(
+            run_google_io(
                 docs_service.documents()
                 .get(
                     documentId=document_id,
@@ -2446,7 +2666,7 @@ async def get_doc_as_markdown(
     page_token = None
 
     while True:
-        response = await asyncio.to_thread(
+        response = await run_google_io(
             drive_service.comments()
             .list(
                 fileId=document_id,
@@ -2593,8 +2813,10 @@ async def manage_doc_tab(
     Returns:
         dict with action result including document link
     """
-    logger.info(f"[manage_doc_tab] action={action}, doc={document_id}, tab_id={tab_id}")
-    link = f"https://docs.google.com/document/d/{document_id}/edit"
+    logger.info(
+        "[manage_doc_tab] action=%s, doc=%s, tab_id=%s", action, document_id, tab_id
+    )
+    link = _DOC_EDIT_URL(document_id)
 
     if action == "create":
         if not title:
@@ -2603,7 +2825,7 @@ async def manage_doc_tab(
             raise UserInputError("'index' is required for the 'create' action.")
 
         request = create_insert_doc_tab_request(title, index, parent_tab_id)
-        result = await asyncio.to_thread(
+        result = await run_google_io(
             service.documents()
             .batchUpdate(documentId=document_id, body={"requests": [request]})
             .execute
@@ -2638,7 +2860,7 @@ async def manage_doc_tab(
             raise UserInputError("'tab_id' is required for the 'delete' action.")
 
         request = create_delete_doc_tab_request(tab_id)
-        await asyncio.to_thread(
+        await run_google_io(
             service.documents()
             .batchUpdate(documentId=document_id, body={"requests": [request]})
             .execute
@@ -2659,7 +2881,7 @@ async def manage_doc_tab(
             raise UserInputError("'title' is required for the 'rename' action.")
 
         request = create_update_doc_tab_request(tab_id, title)
-        await asyncio.to_thread(
+        await run_google_io(
             service.documents()
             .batchUpdate(documentId=document_id, body={"requests": [request]})
             .execute
@@ -2685,8 +2907,14 @@ async def manage_doc_tab(
 
     all_requests: List[dict] = []
 
-    doc = await asyncio.to_thread(
-        service.documents().get(documentId=document_id, includeTabsContent=True).execute
+    doc = await run_google_io(
+        service.documents()
+        .get(
+            documentId=document_id,
+            includeTabsContent=True,
+            fields=_TAB_END_INDEX_FIELDS,
+        )
+        .execute
     )
     try:
         tab_end = _find_tab_end_index(doc, tab_id)
@@ -2734,7 +2962,7 @@ async def manage_doc_tab(
             "link": link,
         }
 
-    await asyncio.to_thread(
+    await run_google_io(
         service.documents()
         .batchUpdate(documentId=document_id, body={"requests": all_requests})
         .execute
@@ -6,8 +6,7 @@ extracting complex validation and request building logic.
 """
 
 import logging
-import asyncio
-from typing import Any, Union, Dict, List, Tuple
+from typing import Any, Union, Dict, List, Optional, Tuple
 
 from gdocs.docs_helpers import (
     create_insert_text_request,
@@ -38,12 +37,38 @@ from gdocs.docs_helpers import (
     create_merge_table_cells_request,
     create_unmerge_table_cells_request,
     create_update_table_column_properties_request,
+    describe_text_format,
     validate_operation,
 )
 from gdocs.managers.validation_manager import ValidationManager
+from core.utils import run_google_io
 
 logger = logging.getLogger(__name__)
 
+# Docs batchUpdate accepts at most this many subrequests per call
+MAX_BATCH_UPDATE_REQUESTS = 500
+
+# Operations addressed by a single document position that may be reordered
+# when the caller opts out of preserve_order
+REORDERABLE_OPERATION_TYPES = frozenset(
+    {
+        "insert_text",
+        "delete_text",
+        "replace_text",
+        "format_text",
+        "insert_table",
+        "insert_page_break",
+    }
+)
+
+
+def _operation_position(op: dict[str, Any]) -> Optional[int]:
+    """Return the index an operation starts at, or None if it is not reorderable."""
+    if op.get("type") not in REORDERABLE_OPERATION_TYPES or op.get("end_of_segment"):
+        return None
+    position = op.get("start_index", op.get("index"))
+    return position if isinstance(position, int) else None
+
 
 class BatchOperationManager:
     """
@@ -66,7 +91,10 @@ class BatchOperationManager:
         self.validation_manager = ValidationManager()
 
     async def execute_batch_operations(
-        self, document_id: str, operations: list[dict[str, Any]]
+        self,
+        document_id: str,
+        operations: list[dict[str, Any]],
+        preserve_order: bool = True,
     ) -> tuple[bool, str, dict[str, Any]]:
         """
         Execute multiple document operations in a single atomic batch.
@@ -76,6 +104,9 @@ class BatchOperationManager:
         Args:
             document_id: ID of the document to update
             operations: List of operation dictionaries
+            preserve_order: Apply operations in the given order. When False,
+                runs of index-based operations are applied from the highest
+                index down so earlier edits do not shift later ones.
 
         Returns:
             Tuple of (success, message, metadata)
@@ -99,12 +130,23 @@ class BatchOperationManager:
 
             # Validate and build requests
             requests, operation_descriptions = await self._validate_and_build_requests(
-                operations
+                operations, preserve_order
             )
 
             if not requests:
                 return False, "No valid requests could be built from operations", {}
 
+            # Splitting across calls would lose atomicity and could separate
+            # paired requests, so oversized batches are rejected up front.
+            if len(requests) > MAX_BATCH_UPDATE_REQUESTS:
+                return (
+                    False,
+                    f"Batch expands to {len(requests)} API requests; Google Docs "
+                    f"accepts at most {MAX_BATCH_UPDATE_REQUESTS} per batchUpdate. "
+                    "Split the operations across multiple batch_update_doc calls.",
+                    {},
+                )
+
             # Execute the batch
             result = await self._execute_batch_requests(document_id, requests)
 
@@ -118,7 +160,7 @@ class BatchOperationManager:
 
             # Fetch document length after batch for downstream chaining
             try:
-                doc = await asyncio.to_thread(
+                doc = await run_google_io(
                     self.service.documents()
                     .get(documentId=document_id, fields="body/content(endIndex)")
                     .execute
@@ -163,8 +205,13 @@ class BatchOperationManager:
         if not create_ops:
             return None
 
-        doc = await asyncio.to_thread(
-            self.service.documents().get(documentId=document_id).execute
+        doc = await run_google_io(
+            self.service.documents()
+            .get(
+                documentId=document_id,
+                fields="documentStyle,body/content(startIndex,sectionBreak)",
+            )
+            .execute
         )
 
         style_field_map = {
@@ -224,14 +271,46 @@ class BatchOperationManager:
 
         return None
 
+    def _order_operations(
+        self, operations: list[dict[str, Any]], preserve_order: bool
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """
+        Pair operations with their original positions, in execution order.
+
+        Unless preserve_order is set, each run of consecutive index-based
+        operations is stably sorted by descending index, assuming the caller
+        took every index from the document as it was before the batch. Any
+        other operation ends the run and keeps its place.
+        """
+        numbered = list(enumerate(operations))
+        if preserve_order:
+            return numbered
+
+        ordered: list[tuple[int, dict[str, Any]]] = []
+        run: list[tuple[int, dict[str, Any]]] = []
+        for item in numbered:
+            if _operation_position(item[1]) is None:
+                ordered.extend(
+                    sorted(run, key=lambda it: _operation_position(it[1]), reverse=True)
+                )
+                run.clear()
+                ordered.append(item)
+            else:
+                run.append(item)
+        ordered.extend(
+            sorted(run, key=lambda it: _operation_position(it[1]), reverse=True)
+        )
+        return ordered
+
     async def _validate_and_build_requests(
-        self, operations: list[dict[str, Any]]
+        self, operations: list[dict[str, Any]], preserve_order: bool = True
     ) -> tuple[list[dict[str, Any]], list[str]]:
         """
         Validate operations and build API requests.
 
         Args:
             operations: List of operation dictionaries
+            preserve_order: Keep the caller's order (see execute_batch_operations)
 
         Returns:
             Tuple of (requests, operation_descriptions)
@@ -239,12 +318,13 @@ class BatchOperationManager:
         requests = []
         operation_descriptions = []
 
+        # Validate every operation structure before building any request
         for i, op in enumerate(operations):
-            # Validate operation structure
             is_valid, error_msg = validate_operation(op)
             if not is_valid:
                 raise ValueError(f"Operation {i + 1}: {error_msg}")
 
+        for i, op in self._order_operations(operations, preserve_order):
             op_type = op.get("type")
 
             try:
@@ -353,32 +433,10 @@ class BatchOperationManager:
             if not request:
                 raise ValueError("No formatting options provided")
 
-            format_changes = []
-            for param, name in [
-                ("bold", "bold"),
-                ("italic", "italic"),
-                ("underline", "underline"),
-                ("strikethrough", "strikethrough"),
-                ("font_size", "font size"),
-                ("font_family", "font family"),
-                ("font_weight", "font weight"),
-                ("text_color", "text color"),
-                ("background_color", "background color"),
-                ("link_url", "link"),
-                ("clear_link", "clear link"),
-                ("baseline_offset", "baseline offset"),
-                ("small_caps", "small caps"),
-            ]:
-                if op.get(param) is not None:
-                    if param == "font_size":
-                        value = f"{op[param]}pt"
-                    elif param == "font_weight":
-                        value = f"{op[param]}w"
-                    else:
-                        value = op[param]
-                    format_changes.append(f"{name}: {value}")
-
-            description = f"format text {op['start_index']}-{op['end_index']} ({', '.join(format_changes)})"
+            description = (
+                f"format text {op['start_index']}-{op['end_index']} "
+                f"({describe_text_format(op)})"
+            )
 
         elif op_type == "update_paragraph_style":
             request = create_update_paragraph_style_request(
@@ -862,7 +920,7 @@ class BatchOperationManager:
         Returns:
             API response
         """
-        return await asyncio.to_thread(
+        return await run_google_io(
             self.service.documents()
             .batchUpdate(documentId=document_id, body={"requests": requests})
             .execute
@@ -6,7 +6,6 @@ in Google Docs, extracting complex logic from the main tools module.
 """
 
 import logging
-import asyncio
 from typing import Any, Optional
 
 from gdocs.docs_helpers import (
@@ -14,9 +13,13 @@ from gdocs.docs_helpers import (
     create_delete_range_request,
     create_insert_text_request,
 )
+from core.utils import run_google_io
 
 logger = logging.getLogger(__name__)
 
+# Documents read and written per batched HTTP request
+HEADER_FOOTER_BATCH_SIZE = 25
+
 
 class HeaderFooterManager:
     """
@@ -72,16 +75,9 @@ class HeaderFooterManager:
         """
         logger.info(f"Updating {section_type} in document {document_id}")
 
-        # Validate section type
-        if section_type not in ["header", "footer"]:
-            return False, "section_type must be 'header' or 'footer'"
-
-        # Validate header/footer type
-        if header_footer_type not in ["DEFAULT", "FIRST_PAGE_ONLY", "EVEN_PAGE"]:
-            return (
-                False,
-                "header_footer_type must be 'DEFAULT', 'FIRST_PAGE_ONLY', or 'EVEN_PAGE'",
-            )
+        param_error = self._validate_section_params(section_type, header_footer_type)
+        if param_error:
+            return False, param_error
 
         try:
             # Get document structure
@@ -102,13 +98,10 @@ class HeaderFooterManager:
                         False,
                         f"No {section_type} found in document and automatic creation failed",
                     )
-                doc = await self._get_document(document_id)
-                target_doc, active_tab_id = self._get_target_doc_for_header_footer(doc)
-                target_section = (
-                    target_doc.get("headers", {}).get(created_id)
-                    if section_type == "header"
-                    else target_doc.get("footers", {}).get(created_id)
-                )
+                # A freshly created segment is empty, so skip re-reading the
+                # document: with no paragraph to replace, the write appends to
+                # the end of the segment. The retry below still re-fetches.
+                target_section = None
                 section_id = created_id
 
             # Update the content
@@ -138,6 +131,12 @@ class HeaderFooterManager:
                         refreshed_tab_id,
                     )
 
+            if success and replace_message == "unchanged":
+                return (
+                    True,
+                    f"No change needed: {section_type} in document {document_id} "
+                    "already contains the requested content",
+                )
             if success:
                 return True, f"Updated {section_type} content in document {document_id}"
             else:
@@ -147,9 +146,137 @@ class HeaderFooterManager:
             logger.error(f"Failed to update {section_type}: {str(e)}")
             return False, f"Failed to update {section_type}: {str(e)}"
 
+    async def update_header_footer_content_batch(
+        self,
+        document_ids: list[str],
+        section_type: str,
+        content: str,
+        header_footer_type: str = "DEFAULT",
+    ) -> dict[str, tuple[bool, str]]:
+        """
+        Updates the same header or footer content across several documents.
+
+        Documents are read and written with batched HTTP requests, so each
+        chunk of HEADER_FOOTER_BATCH_SIZE documents costs two round trips.
+        Documents that need a new header/footer, or whose batched read or
+        write fails, fall back to update_header_footer_content one by one.
+
+        Args:
+            document_ids: IDs of the documents to update
+            section_type: Type of section ("header" or "footer")
+            content: New content for the section
+            header_footer_type: Type of header/footer ("DEFAULT", "FIRST_PAGE_ONLY", "EVEN_PAGE")
+
+        Returns:
+            Dict mapping each document ID to a (success, message) tuple
+        """
+        document_ids = list(dict.fromkeys(document_ids))
+        logger.info(f"Updating {section_type} in {len(document_ids)} documents")
+
+        param_error = self._validate_section_params(section_type, header_footer_type)
+        if param_error:
+            return {document_id: (False, param_error) for document_id in document_ids}
+
+        documents = self.service.documents()
+        results: dict[str, tuple[bool, str]] = {}
+
+        for chunk_start in range(0, len(document_ids), HEADER_FOOTER_BATCH_SIZE):
+            chunk_ids = document_ids[
+                chunk_start : chunk_start + HEADER_FOOTER_BATCH_SIZE
+            ]
+            fetched = await self._execute_batch(
+                {
+                    document_id: documents.get(
+                        documentId=document_id, includeTabsContent=True
+                    )
+                    for document_id in chunk_ids
+                }
+            )
+
+            writes = {}
+            for document_id in chunk_ids:
+                doc, error = fetched.get(document_id, (None, None))
+                if not doc or error is not None:
+                    continue
+                target_doc, tab_id = self._get_target_doc_for_header_footer(doc)
+                section, section_id = await self._find_target_section(
+                    target_doc, section_type, header_footer_type
+                )
+                if not section_id:
+                    continue
+                requests = self._build_replace_requests(
+                    section, content, section_id, tab_id
+                )
+                if requests is None:
+                    results[document_id] = (
+                        True,
+                        f"No change needed: {section_type} in document {document_id} "
+                        "already contains the requested content",
+                    )
+                    continue
+                writes[document_id] = documents.batchUpdate(
+                    documentId=document_id, body={"requests": requests}
+                )
+
+            if not writes:
+                continue
+            written = await self._execute_batch(writes)
+            for document_id in writes:
+                if document_id in written and written[document_id][1] is None:
+                    results[document_id] = (
+                        True,
+                        f"Updated {section_type} content in document {document_id}",
+                    )
+
+        # Creation, retries and error reporting are handled by the single-document path
+        for document_id in document_ids:
+            if document_id not in results:
+                results[document_id] = await self.update_header_footer_content(
+                    document_id, section_type, content, header_footer_type
+                )
+
+        return {document_id: results[document_id] for document_id in document_ids}
+
+    def _validate_section_params(
+        self, section_type: str, header_footer_type: str
+    ) -> Optional[str]:
+        """Return an error message for an unsupported section or header/footer type."""
+        if section_type not in ["header", "footer"]:
+            return "section_type must be 'header' or 'footer'"
+        if header_footer_type not in ["DEFAULT", "FIRST_PAGE_ONLY", "EVEN_PAGE"]:
+            return "header_footer_type must be 'DEFAULT', 'FIRST_PAGE_ONLY', or 'EVEN_PAGE'"
+        return None
+
+    async def _execute_batch(
+        self, requests: dict[str, Any]
+    ) -> dict[str, tuple[Any, Optional[Exception]]]:
+        """
+        Execute API requests in one batched HTTP call.
+
+        Args:
+            requests: Mapping of request ID to an unexecuted API request
+
+        Returns:
+            Mapping of request ID to (response, exception); empty if the batch
+            itself could not be sent
+        """
+        results: dict[str, tuple[Any, Optional[Exception]]] = {}
+
+        def _batch_callback(request_id, response, exception):
+            results[request_id] = (response, exception)
+
+        batch = self.service.new_batch_http_request(callback=_batch_callback)
+        for request_id, request in requests.items():
+            batch.add(request, request_id=request_id)
+        try:
+            await run_google_io(batch.execute)
+        except Exception as e:
+            logger.warning(f"Batch request failed, falling back to single calls: {e}")
+        return results
+
     async def _get_document(self, document_id: str) -> dict[str, Any]:
         """Get the full document data."""
-        return await asyncio.to_thread(
+        return await run_google_io(
             self.service.documents()
             .get(documentId=document_id, includeTabsContent=True)
             .execute
@@ -284,46 +411,50 @@ class HeaderFooterManager:
         Returns:
             Tuple of (success, message)
         """
-        content_elements = section.get("content", []) if section else []
-        first_para = self._find_first_paragraph(content_elements)
-        has_meaningful_content = self._segment_has_meaningful_content(content_elements)
-        if first_para:
-            start_index = first_para.get("startIndex", 0)
-            end_index = first_para.get("endIndex", 0)
-        else:
-            start_index = 0
-            end_index = 0
-
-        # Build requests to replace content
-        requests = []
+        requests = self._build_replace_requests(
+            section, new_content, section_id, tab_id
+        )
+        if requests is None:
+            return True, "unchanged"
 
-        # Delete existing content if any (preserve paragraph structure)
-        # Docs segments often contain a single empty paragraph marker. Deleting
-        # start..end-1 in that case produces an empty range, which the API rejects.
-        if has_meaningful_content and end_index - start_index > 1:
-            requests.append(
-                create_delete_range_request(
-                    start_index,
-                    end_index - 1,  # Preserve the trailing paragraph marker
-                    tab_id=tab_id,
-                    segment_id=section_id,
-                )
+        try:
+            await run_google_io(
+                self.service.documents()
+                .batchUpdate(documentId=document_id, body={"requests": requests})
+                .execute
             )
+            return True, "ok"
 
-        # Insert new content
-        if first_para and has_meaningful_content:
-            requests.append(
-                create_insert_text_request(
-                    start_index,
-                    new_content,
-                    tab_id=tab_id,
-                    segment_id=section_id,
-                )
+        except Exception as e:
+            logger.error(f"Failed to replace section content: {str(e)}")
+            return (
+                False,
+                f"Failed to write {section_id} segment content: {str(e)}",
             )
-        else:
+
+    def _build_replace_requests(
+        self,
+        section: Optional[dict[str, Any]],
+        new_content: str,
+        section_id: str,
+        tab_id: Optional[str],
+    ) -> Optional[list[dict[str, Any]]]:
+        """
+        Build the requests that replace a header/footer's first paragraph.
+
+        Returns:
+            List of requests, or None when the section already holds new_content
+        """
+        content_elements = section.get("content", []) if section else []
+        first_para = (
+            self._find_first_paragraph(content_elements)
+            if self._segment_has_meaningful_content(content_elements)
+            else None
+        )
+        if not first_para:
             # Newly created or empty segments may not expose paragraph content yet.
             # Append directly to the segment so callers do not need a follow-up create.
-            requests.append(
+            return [
                 create_insert_text_request(
                     None,
                     new_content,
@@ -331,22 +462,47 @@ class HeaderFooterManager:
                     segment_id=section_id,
                     end_of_segment=True,
                 )
-            )
+            ]
 
-        try:
-            await asyncio.to_thread(
-                self.service.documents()
-                .batchUpdate(documentId=document_id, body={"requests": requests})
-                .execute
+        start_index = first_para.get("startIndex", 0)
+        end_index = first_para.get("endIndex", 0)
+
+        # Writing the same text back would only cost a batchUpdate round trip
+        existing_text = "".join(
+            para_element["textRun"].get("content", "")
+            for para_element in first_para["paragraph"].get("elements", [])
+            if "textRun" in para_element
+        )
+        if existing_text == new_content + "\n":
+            return None
+
+        # Build requests to replace content
+        requests = []
+
+        # Delete existing content (preserve paragraph structure)
+        # Deleting start..end-1 of a bare paragraph marker produces an empty
+        # range, which the API rejects.
+        if end_index - start_index > 1:
+            requests.append(
+                create_delete_range_request(
+                    start_index,
+                    end_index - 1,  # Preserve the trailing paragraph marker
+                    tab_id=tab_id,
+                    segment_id=section_id,
+                )
             )
-            return True, "ok"
 
-        except Exception as e:
-            logger.error(f"Failed to replace section content: {str(e)}")
-            return (
-                False,
-                f"Failed to write {section_id} segment content: {str(e)}",
+        # Insert new content
+        requests.append(
+            create_insert_text_request(
+                start_index,
+                new_content,
+                tab_id=tab_id,
+                segment_id=section_id,
             )
+        )
+
+        return requests
 
     def _segment_has_meaningful_content(
         self, content_elements: list[dict[str, Any]]
@@ -355,18 +511,12 @@ class HeaderFooterManager:
         Return True when a header/footer segment contains user-visible text beyond
         the default empty paragraph marker.
         """
-        for element in content_elements:
-            paragraph = element.get("paragraph")
-            if not paragraph:
-                continue
-            for para_element in paragraph.get("elements", []):
-                text_run = para_element.get("textRun")
-                if not text_run:
-                    continue
-                content = text_run.get("content", "")
-                if content.strip():
-                    return True
-        return False
+        return any(
+            para_element["textRun"].get("content", "").strip()
+            for element in content_elements
+            for para_element in (element.get("paragraph") or {}).get("elements", [])
+            if para_element.get("textRun")
+        )
 
     async def _create_missing_section(
         self, document_id: str, section_type: str, header_footer_type: str = "DEFAULT"
@@ -374,7 +524,7 @@ class HeaderFooterManager:
         """Create a missing header/footer and return its new segment ID."""
         request = create_create_header_footer_request(section_type, header_footer_type)
         try:
-            result = await asyncio.to_thread(
+            result = await run_google_io(
                 self.service.documents()
                 .batchUpdate(documentId=document_id, body={"requests": [request]})
                 .execute
@@ -446,13 +596,13 @@ class HeaderFooterManager:
         content_elements = section_data.get("content", [])
 
         # Extract text content
-        text_content = ""
-        for element in content_elements:
-            if "paragraph" in element:
-                para = element["paragraph"]
-                for para_element in para.get("elements", []):
-                    if "textRun" in para_element:
-                        text_content += para_element["textRun"].get("content", "")
+        text_content = "".join(
+            para_element["textRun"].get("content", "")
+            for element in content_elements
+            if "paragraph" in element
+            for para_element in element["paragraph"].get("elements", [])
+            if "textRun" in para_element
+        )
 
         return {
             "content_preview": text_content[:100] if text_content else "(empty)",
@@ -508,7 +658,7 @@ class HeaderFooterManager:
                 batch_request = {"createFooter": request}
 
             # Execute the request
-            await asyncio.to_thread(
+            await run_google_io(
                 self.service.documents()
                 .batchUpdate(documentId=document_id, body={"requests": [batch_request]})
                 .execute
@@ -6,12 +6,12 @@ multiple Google Docs API calls for complex table manipulations.
 """
 
 import logging
-import asyncio
 from typing import List, Dict, Any, Tuple, Optional
 
 from gdocs.docs_helpers import create_insert_table_request, create_insert_text_request
 from gdocs.docs_structure import find_tables
 from gdocs.docs_tables import validate_table_data
+from core.utils import run_google_io
 
 logger = logging.getLogger(__name__)
 
@@ -122,7 +122,7 @@ class TableOperationManager:
         """Create an empty table at the specified index."""
         logger.debug(f"Creating {rows}x{cols} table at index {index}")
 
-        await asyncio.to_thread(
+        await run_google_io(
             self.service.documents()
             .batchUpdate(
                 documentId=document_id,
@@ -137,7 +137,7 @@ class TableOperationManager:
         self, document_id: str, tab_id: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Get fresh document structure and extract table information."""
-        doc = await asyncio.to_thread(
+        doc = await run_google_io(
             self.service.documents()
             .get(documentId=document_id, includeTabsContent=True)
             .execute
@@ -300,7 +300,7 @@ class TableOperationManager:
         )
 
         # Execute all insertions in a single batchUpdate
-        await asyncio.to_thread(
+        await run_google_io(
             self.service.documents()
             .batchUpdate(
                 documentId=document_id,
@@ -421,7 +421,7 @@ class TableOperationManager:
             population_count += 1
 
         if requests:
-            await asyncio.to_thread(
+            await run_google_io(
                 self.service.documents()
                 .batchUpdate(
                     documentId=document_id,
@@ -28,9 +28,12 @@ logger = logging.getLogger(__name__)
 
 VALID_SHARE_ROLES = {"reader", "commenter", "writer"}
 VALID_SHARE_TYPES = {"user", "group", "domain", "anyone"}
+PUBLIC_LINK_ROLES = frozenset({"reader", "writer", "commenter"})
 
 
-def check_public_link_permission(permissions: List[Dict[str, Any]]) -> bool:
+def check_public_link_permission(
+    permissions: Optional[List[Dict[str, Any]]],
+) -> bool:
     """
     Check if file has 'anyone with the link' permission.
 
@@ -41,11 +44,26 @@ def check_public_link_permission(permissions: List[Dict[str, Any]]) -> bool:
         bool: True if file has public link sharing enabled
     """
     return any(
-        p.get("type") == "anyone" and p.get("role") in ["reader", "writer", "commenter"]
-        for p in permissions
+        p.get("type") == "anyone" and p.get("role") in PUBLIC_LINK_ROLES
+        for p in permissions or ()
     )
 
 
+def escape_drive_query_value(value: str) -> str:
+    """
+    Escape a value for use inside a single-quoted Drive query string.
+
+    Drive requires backslashes and single quotes to be backslash-escaped.
+
+    Args:
+        value: Raw user-supplied text
+
+    Returns:
+        str: Text safe to place between single quotes in a ``q`` parameter
+    """
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
 def format_public_sharing_error(file_name: str, file_id: str) -> str:
     """
     Format error message for files without public sharing.
@@ -48,6 +48,7 @@ from gdrive.drive_helpers import (
     _stream_url_with_validation,
     build_drive_list_params,
     check_public_link_permission,
+    escape_drive_query_value,
     format_permission_info,
     get_drive_image_url,
     resolve_drive_item,
@@ -141,7 +142,7 @@ async def search_drive_files(
         )
     else:
         # For free text queries, wrap in fullText contains
-        escaped_query = query.replace("'", "\\'")
+        escaped_query = escape_drive_query_value(query)
         final_query = f"fullText contains '{escaped_query}'"
         logger.info(
             f"[search_drive_files] Reformatting free text query '{query}' to '{final_query}'"
@@ -1612,7 +1613,7 @@ async def check_drive_file_public_access(
     )
 
     # Search for the file
-    escaped_name = file_name.replace("'", "\\'")
+    escaped_name = escape_drive_query_value(file_name)
     query = f"name = '{escaped_name}'"
 
     list_params: Dict[str, Any] = {
@@ -7,6 +7,7 @@ GCS is mocked at the client level — these tests do not hit real GCS.
 """
 
 import json
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -354,6 +355,26 @@ class TestBackendSelection:
         monkeypatch.delenv("WORKSPACE_MCP_GCS_REQUIRE_CMEK", raising=False)
         assert isinstance(get_credential_store(), GCSCredentialStore)
 
+    def test_concurrent_first_calls_share_one_store(self, monkeypatch, tmp_path):
+        """Racing first calls must not construct separate store instances."""
+        monkeypatch.delenv("WORKSPACE_MCP_CREDENTIAL_STORE_BACKEND", raising=False)
+        monkeypatch.setenv("WORKSPACE_MCP_CREDENTIALS_DIR", str(tmp_path))
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(get_credential_store())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 8
+        assert len({id(store) for store in results}) == 1
+
 
 class TestParseBoolEnv:
     """The strict bool parser used for security-relevant flags.
@@ -7,6 +7,7 @@ import pytest
 
 from auth.google_auth import _build_authorized_http, get_authenticated_google_service
 from auth.google_auth import get_user_info
+from core.api_json import get_api_json_model
 
 
 def test_build_authorized_http_uses_explicit_timeout():
@@ -62,7 +63,9 @@ def test_get_user_info_builds_service_with_authorized_http(monkeypatch):
     monkeypatch.setattr("auth.google_auth.build", build)
 
     assert get_user_info(credentials) == {"email": "user@example.com"}
-    build.assert_called_once_with("oauth2", "v2", http=authorized_http)
+    build.assert_called_once_with(
+        "oauth2", "v2", http=authorized_http, model=get_api_json_model()
+    )
 
 
 @pytest.mark.asyncio
@@ -98,4 +101,6 @@ async def test_get_authenticated_google_service_builds_service_with_authorized_h
 
     assert result is service
     assert user_email == "user@example.com"
-    build.assert_called_once_with("gmail", "v1", http=authorized_http)
+    build.assert_called_once_with(
+        "gmail", "v1", http=authorized_http, model=get_api_json_model()
+    )
@@ -1,5 +1,11 @@
+import json
+import os
+import stat
+import threading
+
 import pytest
 
+import auth.oauth21_session_store as session_store_module
 from auth.oauth21_session_store import OAuth21SessionStore
 
 
@@ -116,6 +122,161 @@ def test_consume_latest_oauth_state_filters_by_initiating_session_id(tmp_path):
     assert remaining_state_info["code_verifier"] == "verifier-none"
 
 
+def test_oauth_state_cache_skips_reparse_when_file_unchanged(tmp_path, monkeypatch):
+    state_file = tmp_path / "oauth_states.json"
+    store = OAuth21SessionStore(oauth_state_file=str(state_file))
+
+    store.store_oauth_state("state-one", session_id="session-123")
+
+    def fail_loads(*args, **kwargs):
+        raise AssertionError("state file should not be re-parsed")
+
+    monkeypatch.setattr(session_store_module, "_loads_oauth_states", fail_loads)
+
+    state_info = store.validate_and_consume_oauth_state(
+        "state-one", session_id="session-123"
+    )
+
+    assert state_info["session_id"] == "session-123"
+
+
+def test_oauth_state_cache_reloads_after_external_write(tmp_path):
+    state_file = tmp_path / "oauth_states.json"
+    store_a = OAuth21SessionStore(oauth_state_file=str(state_file))
+    store_b = OAuth21SessionStore(oauth_state_file=str(state_file))
+
+    store_a.store_oauth_state("state-a", session_id="session-a")
+    store_b.store_oauth_state("state-b", session_id="session-b")
+
+    state_info = store_a.validate_and_consume_oauth_state(
+        "state-b", session_id="session-b"
+    )
+
+    assert state_info["session_id"] == "session-b"
+    with pytest.raises(ValueError, match="Invalid or expired"):
+        store_b.validate_and_consume_oauth_state("state-b", session_id="session-b")
+
+
+def test_oauth_state_file_written_without_orjson(tmp_path, monkeypatch):
+    monkeypatch.setattr(session_store_module, "orjson", None)
+    state_file = tmp_path / "oauth_states.json"
+    store = OAuth21SessionStore(oauth_state_file=str(state_file))
+
+    store.store_oauth_state("state-one", session_id="session-123")
+
+    payload = json.loads(state_file.read_text(encoding="utf-8"))
+    assert payload["state-one"]["session_id"] == "session-123"
+
+
+def test_failed_oauth_state_write_leaves_existing_file_intact(tmp_path, monkeypatch):
+    state_file = tmp_path / "oauth_states.json"
+    store = OAuth21SessionStore(oauth_state_file=str(state_file))
+    store.store_oauth_state("state-one", session_id="session-123")
+    original_contents = state_file.read_text(encoding="utf-8")
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(session_store_module.os, "replace", fail_replace)
+
+    with pytest.raises(OSError, match="disk full"):
+        store.store_oauth_state("state-two", session_id="session-456")
+
+    assert state_file.read_text(encoding="utf-8") == original_contents
+    assert not (tmp_path / "oauth_states.json.tmp").exists()
+
+
+def test_rejected_oauth_state_does_not_rewrite_state_file(tmp_path):
+    state_file = tmp_path / "oauth_states.json"
+    store = OAuth21SessionStore(oauth_state_file=str(state_file))
+    store.store_oauth_state("state-one", session_id="session-123")
+    stat_before = state_file.stat()
+
+    with pytest.raises(ValueError, match="Invalid or expired"):
+        store.validate_and_consume_oauth_state("unknown-state")
+
+    stat_after = state_file.stat()
+    assert stat_after.st_ino == stat_before.st_ino
+    assert stat_after.st_mtime_ns == stat_before.st_mtime_ns
+
+
+def test_oauth_state_directory_recreated_after_removal(tmp_path):
+    state_dir = tmp_path / "creds"
+    state_file = state_dir / "oauth_states.json"
+    store = OAuth21SessionStore(oauth_state_file=str(state_file))
+    store.store_oauth_state("state-one", session_id="session-123")
+
+    for path in state_dir.iterdir():
+        path.unlink()
+    state_dir.rmdir()
+
+    store.store_oauth_state("state-two", session_id="session-456")
+
+    assert state_file.exists()
+
+
+def test_expired_oauth_state_rejected_between_cleanup_sweeps(tmp_path):
+    state_file = tmp_path / "oauth_states.json"
+    store = OAuth21SessionStore(oauth_state_file=str(state_file))
+    store.store_oauth_state("fresh-state", session_id="session-123")
+    store.store_oauth_state(
+        "stale-state", session_id="session-123", expires_in_seconds=0
+    )
+
+    with pytest.raises(ValueError, match="Invalid or expired"):
+        store.validate_and_consume_oauth_state("stale-state", session_id="session-123")
+
+    state_info = store.consume_latest_oauth_state(initiating_session_id="session-123")
+    assert state_info is not None
+    assert state_info["expires_at"] > state_info["created_at"]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+def test_oauth_state_file_is_private_regardless_of_umask(tmp_path):
+    state_file = tmp_path / "oauth_states.json"
+    store = OAuth21SessionStore(oauth_state_file=str(state_file))
+
+    previous_umask = os.umask(0o022)
+    try:
+        store.store_oauth_state("state-one", session_id="session-123")
+    finally:
+        os.umask(previous_umask)
+
+    assert stat.S_IMODE(state_file.stat().st_mode) == 0o600
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_oauth_state_file_read_through_mmap(tmp_path, monkeypatch, use_orjson):
+    monkeypatch.setattr(session_store_module, "_OAUTH_STATE_MMAP_MIN_BYTES", 1)
+    if not use_orjson:
+        monkeypatch.setattr(session_store_module, "orjson", None)
+    state_file = tmp_path / "oauth_states.json"
+    store_a = OAuth21SessionStore(oauth_state_file=str(state_file))
+    store_b = OAuth21SessionStore(oauth_state_file=str(state_file))
+
+    store_a.store_oauth_state("mapped-state", session_id="session-123")
+
+    state_info = store_b.validate_and_consume_oauth_state(
+        "mapped-state", session_id="session-123"
+    )
+    assert state_info["session_id"] == "session-123"
+
+
+def test_session_lookups_not_blocked_by_oauth_state_operations(tmp_path):
+    state_file = tmp_path / "oauth_states.json"
+    store = OAuth21SessionStore(oauth_state_file=str(state_file))
+    results = []
+
+    with store._oauth_state_lock:
+        lookup = threading.Thread(
+            target=lambda: results.append(store.has_session("user@example.com"))
+        )
+        lookup.start()
+        lookup.join(timeout=5)
+
+    assert results == [False]
+
+
 def test_deserialize_oauth_state_entry_normalizes_invalid_and_naive_timestamps(
     tmp_path,
 ):
@@ -130,11 +291,47 @@ def test_deserialize_oauth_state_entry_normalizes_invalid_and_naive_timestamps(
         }
     )
 
-    assert deserialized["created_at"] is not None
-    assert deserialized["created_at"].tzinfo is not None
+    assert deserialized["created_at"] == 1776772800.0
     assert deserialized["expires_at"] is None
 
 
+def test_oauth_state_file_stores_epoch_timestamps(tmp_path):
+    state_file = tmp_path / "oauth_states.json"
+    store = OAuth21SessionStore(oauth_state_file=str(state_file))
+
+    store.store_oauth_state(
+        "state-one", session_id="session-123", expires_in_seconds=300
+    )
+
+    entry = json.loads(state_file.read_text(encoding="utf-8"))["state-one"]
+    assert isinstance(entry["created_at"], float)
+    assert entry["expires_at"] == pytest.approx(entry["created_at"] + 300)
+
+
+def test_legacy_iso_oauth_state_file_is_still_readable(tmp_path):
+    state_file = tmp_path / "oauth_states.json"
+    state_file.write_text(
+        json.dumps(
+            {
+                "legacy-state": {
+                    "session_id": "session-123",
+                    "code_verifier": "legacy-verifier",
+                    "created_at": "2026-04-21T12:00:00+00:00",
+                    "expires_at": "2999-01-01T00:00:00+00:00",
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+    store = OAuth21SessionStore(oauth_state_file=str(state_file))
+
+    state_info = store.validate_and_consume_oauth_state(
+        "legacy-state", session_id="session-123"
+    )
+
+    assert state_info["code_verifier"] == "legacy-verifier"
+
+
 def test_store_session_rejects_mcp_session_rebind_by_default(tmp_path):
     state_file = tmp_path / "oauth_states.json"
     store = OAuth21SessionStore(oauth_state_file=str(state_file))
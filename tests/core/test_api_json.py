@@ -0,0 +1,54 @@
+"""Tests for the orjson-backed googleapiclient JSON model."""
+
+import json
+
+import pytest
+from googleapiclient.model import JsonModel
+
+import core.api_json as api_json
+
+pytestmark = pytest.mark.skipif(
+    api_json.orjson is None, reason="orjson is an optional speedup"
+)
+
+
+@pytest.fixture
+def model():
+    return api_json.OrjsonJsonModel()
+
+
+def test_shared_model_is_orjson_backed():
+    assert isinstance(api_json.get_api_json_model(), api_json.OrjsonJsonModel)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"requests": [{"insertText": {"location": {"index": 1}, "text": "hi"}}]},
+        {"text": "café \U0001f600"},
+        {1: "non-string key"},
+        [1, 2, 3],
+    ],
+)
+def test_serialize_round_trips_like_default_model(model, body):
+    encoded = model.serialize(body)
+
+    assert isinstance(encoded, str)
+    assert encoded.isascii()
+    assert json.loads(encoded) == json.loads(JsonModel().serialize(body))
+
+
+def test_serialize_keeps_data_wrapper(model):
+    wrapped = api_json.OrjsonJsonModel(data_wrapper=True)
+
+    assert json.loads(wrapped.serialize({"a": 1})) == {"data": {"a": 1}}
+    assert json.loads(model.serialize({"a": 1})) == {"a": 1}
+
+
+@pytest.mark.parametrize("content", [b'{"a": [1, "\\u00e9"]}', '{"a": [1, "é"]}'])
+def test_deserialize_accepts_bytes_and_str(model, content):
+    assert model.deserialize(content) == {"a": [1, "é"]}
+
+
+def test_deserialize_returns_text_for_non_json(model):
+    assert model.deserialize(b"Not Found") == "Not Found"
@@ -0,0 +1,46 @@
+"""Tests for the bounded Google API I/O executor."""
+
+import contextvars
+import threading
+
+import pytest
+
+from core.utils import _get_google_io_workers, run_google_io
+
+_request_id = contextvars.ContextVar("request_id", default=None)
+
+
+@pytest.mark.asyncio
+async def test_run_google_io_uses_dedicated_pool_and_passes_arguments():
+    def call(a, b=0):
+        return threading.current_thread().name, a + b
+
+    thread_name, total = await run_google_io(call, 2, b=3)
+
+    assert thread_name.startswith("google-io")
+    assert total == 5
+
+
+@pytest.mark.asyncio
+async def test_run_google_io_propagates_context_variables():
+    _request_id.set("req-1")
+
+    assert await run_google_io(_request_id.get) == "req-1"
+
+
+@pytest.mark.asyncio
+async def test_run_google_io_reraises_worker_exceptions():
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await run_google_io(fail)
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"), [("", 16), ("8", 8), ("0", 1), ("lots", 16)]
+)
+def test_google_io_worker_count_parses_env_with_fallback(monkeypatch, raw, expected):
+    monkeypatch.setenv("WORKSPACE_MCP_GOOGLE_IO_WORKERS", raw)
+
+    assert _get_google_io_workers() == expected
@@ -0,0 +1,87 @@
+"""Tests for Office Open XML text extraction in core.utils."""
+
+import io
+import zipfile
+
+from core.utils import extract_office_xml_text
+
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+PPTX_MIME = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+X_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+
+
+def _zip(members):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, xml in members.items():
+            zf.writestr(name, xml)
+    return buf.getvalue()
+
+
+def test_docx_text_runs_joined_with_spaces():
+    document = (
+        f'<w:document xmlns:w="{W_NS}"><w:body>'
+        "<w:p><w:r><w:t>Hello</w:t></w:r><w:r><w:t> world </w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>   </w:t></w:r></w:p>"
+        "<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Cell</w:t></w:r></w:p></w:tc></w:tr></w:tbl>"
+        "</w:body></w:document>"
+    )
+
+    text = extract_office_xml_text(_zip({"word/document.xml": document}), DOCX_MIME)
+
+    assert text == "Hello world Cell"
+
+
+def test_pptx_slides_separated_by_blank_line():
+    def slide(*texts):
+        runs = "".join(f"<a:r><a:t>{t}</a:t></a:r>" for t in texts)
+        return f'<p:sld xmlns:p="urn:p" xmlns:a="{A_NS}"><a:p>{runs}</a:p></p:sld>'
+
+    data = _zip(
+        {
+            "ppt/slides/slide1.xml": slide("Title", "Sub"),
+            "ppt/slides/slide2.xml": slide("Second"),
+        }
+    )
+
+    assert extract_office_xml_text(data, PPTX_MIME) == "Title Sub\n\nSecond"
+
+
+def test_xlsx_resolves_shared_strings_and_inline_values():
+    shared = (
+        f'<sst xmlns="{X_NS}">'
+        "<si><t>plain</t></si>"
+        "<si><r><t>rich </t></r><r><t>text</t></r></si>"
+        "</sst>"
+    )
+    sheet = (
+        f'<worksheet xmlns="{X_NS}"><sheetData>'
+        '<row r="1"><c r="A1" t="s"><v>1</v></c><c r="B1"><v>42</v></c></row>'
+        '<row r="2"><c r="A2" t="s"><v>0</v></c><c r="B2"/>'
+        '<c r="C2" t="s"><v>9</v></c></row>'
+        "</sheetData></worksheet>"
+    )
+
+    data = _zip({"xl/sharedStrings.xml": shared, "xl/worksheets/sheet1.xml": sheet})
+
+    assert extract_office_xml_text(data, XLSX_MIME) == "rich text 42 plain"
+
+
+def test_unparseable_member_is_skipped():
+    data = _zip(
+        {
+            "ppt/slides/slide1.xml": "<broken",
+            "ppt/slides/slide2.xml": f'<a:t xmlns:a="{A_NS}">ok</a:t>',
+        }
+    )
+
+    assert extract_office_xml_text(data, PPTX_MIME) == "ok"
+
+
+def test_non_zip_and_unknown_mime_return_none():
+    assert extract_office_xml_text(b"not a zip", DOCX_MIME) is None
+    assert extract_office_xml_text(_zip({"a.xml": "<a/>"}), "text/plain") is None
@@ -4,6 +4,7 @@ from types import SimpleNamespace
 import pytest
 
 import auth.service_decorator as service_decorator
+from core.api_json import get_api_json_model
 import core.server as server_module
 from core.server import SecureFastMCP
 
@@ -151,10 +152,11 @@ async def test_authenticate_service_account_uses_caller_email(monkeypatch):
         captured["subject"] = subject
         return fake_credentials
 
-    def fake_build(service_name, service_version, credentials):
+    def fake_build(service_name, service_version, credentials, model):
         captured["service_name"] = service_name
         captured["service_version"] = service_version
         captured["credentials"] = credentials
+        captured["model"] = model
         return fake_service
 
     monkeypatch.setattr(
@@ -183,6 +185,7 @@ async def test_authenticate_service_account_uses_caller_email(monkeypatch):
         "service_name": "gmail",
         "service_version": "v1",
         "credentials": fake_credentials,
+        "model": get_api_json_model(),
     }
 
 
@@ -238,7 +241,7 @@ def _patch_service_account(monkeypatch, *, allowed_domains=""):
         captured["subject"] = subject
         return fake_credentials
 
-    def fake_build(service_name, service_version, credentials):
+    def fake_build(service_name, service_version, credentials, model):
         return fake_service
 
     monkeypatch.setattr(
@@ -0,0 +1,111 @@
+"""
+Tests for batch_update_doc operation ordering.
+
+Covers the default caller order, the descending-index reordering used
+when preserve_order is disabled, up-front validation, and rejection of
+batches over the batchUpdate request limit.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from gdocs.managers.batch_operation_manager import BatchOperationManager
+
+
+OPERATIONS = [
+    {"type": "replace_text", "start_index": 5, "end_index": 8, "text": "A"},
+    {"type": "delete_text", "start_index": 20, "end_index": 25},
+    {"type": "find_replace", "find_text": "x", "replace_text": "y"},
+    {"type": "insert_text", "index": 2, "text": "B"},
+    {"type": "format_text", "start_index": 30, "end_index": 31, "bold": True},
+    {"type": "insert_text", "end_of_segment": True, "text": "C"},
+]
+
+
+@pytest.fixture()
+def manager():
+    manager = BatchOperationManager(Mock())
+    manager._execute_batch_requests = AsyncMock(return_value={"replies": []})
+    return manager
+
+
+def _ordered_types(manager, preserve_order):
+    return [
+        (i, op["type"])
+        for i, op in manager._order_operations(OPERATIONS, preserve_order)
+    ]
+
+
+def test_preserve_order_keeps_caller_order(manager):
+    assert _ordered_types(manager, True) == [
+        (i, op["type"]) for i, op in enumerate(OPERATIONS)
+    ]
+
+
+def test_reorder_sorts_index_runs_descending_between_barriers(manager):
+    assert _ordered_types(manager, False) == [
+        (1, "delete_text"),
+        (0, "replace_text"),
+        (2, "find_replace"),
+        (4, "format_text"),
+        (3, "insert_text"),
+        (5, "insert_text"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reordered_replace_requests_stay_paired(manager):
+    success, _, _ = await manager.execute_batch_operations(
+        "doc-123", OPERATIONS[:2], preserve_order=False
+    )
+
+    assert success
+    requests = manager._execute_batch_requests.call_args.args[1]
+    assert [next(iter(r)) for r in requests] == [
+        "deleteContentRange",
+        "deleteContentRange",
+        "insertText",
+    ]
+    assert requests[0]["deleteContentRange"]["range"]["startIndex"] == 20
+    assert requests[2]["insertText"]["location"]["index"] == 5
+
+
+@pytest.mark.asyncio
+async def test_validation_errors_report_original_operation_number(manager):
+    bad = [OPERATIONS[0], {"type": "delete_text", "start_index": 9}]
+
+    success, message, _ = await manager.execute_batch_operations(
+        "doc-123", bad, preserve_order=False
+    )
+
+    assert not success
+    assert "Operation 2" in message
+
+
+@pytest.mark.asyncio
+async def test_oversized_batch_is_rejected_before_any_request_is_sent(
+    manager, monkeypatch
+):
+    from gdocs.managers import batch_operation_manager
+
+    monkeypatch.setattr(batch_operation_manager, "MAX_BATCH_UPDATE_REQUESTS", 2)
+
+    success, message, _ = await manager.execute_batch_operations(
+        "doc-123", OPERATIONS[:2]
+    )
+
+    assert not success
+    assert "expands to 3 API requests" in message
+    manager._execute_batch_requests.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_invalid_later_operation_fails_before_any_request_is_built(manager):
+    manager._build_operation_request = Mock()
+    bad = [OPERATIONS[0], OPERATIONS[1], {"type": "format_text", "start_index": 1}]
+
+    success, message, _ = await manager.execute_batch_operations("doc-123", bad)
+
+    assert not success
+    assert "Operation 3: Missing required field: end_index" in message
+    manager._build_operation_request.assert_not_called()
@@ -0,0 +1,58 @@
+"""Tests for the create_doc tool."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from gdocs import docs_tools
+
+
+def _unwrap(tool):
+    """Unwrap a FunctionTool + decorator chain to the original function."""
+    fn = tool.fn if hasattr(tool, "fn") else tool
+    while hasattr(fn, "__wrapped__"):
+        fn = fn.__wrapped__
+    return fn
+
+
+def _service():
+    service = Mock()
+    service.documents.return_value.create.return_value.execute = Mock(
+        return_value={"documentId": "new123"}
+    )
+    return service
+
+
+@pytest.mark.asyncio
+async def test_create_doc_inserts_initial_content_into_new_doc():
+    service = _service()
+
+    result = await _unwrap(docs_tools.create_doc)(
+        service=service,
+        user_google_email="user@example.com",
+        title="Plan",
+        content="Hello",
+    )
+
+    documents = service.documents.return_value
+    documents.create.assert_called_once_with(body={"title": "Plan"})
+    documents.batchUpdate.assert_called_once_with(
+        documentId="new123",
+        body={
+            "requests": [{"insertText": {"location": {"index": 1}, "text": "Hello"}}]
+        },
+    )
+    assert "(ID: new123)" in result
+    assert "Initial content: 5 characters inserted." in result
+
+
+@pytest.mark.asyncio
+async def test_create_doc_without_content_skips_batch_update():
+    service = _service()
+
+    result = await _unwrap(docs_tools.create_doc)(
+        service=service, user_google_email="user@example.com", title="Empty"
+    )
+
+    service.documents.return_value.batchUpdate.assert_not_called()
+    assert "Document is empty" in result
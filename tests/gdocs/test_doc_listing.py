@@ -0,0 +1,88 @@
+"""Tests for the Drive-backed Google Docs listing tools."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from gdocs import docs_tools
+
+
+def _unwrap(tool):
+    """Unwrap a FunctionTool + decorator chain to the original function."""
+    fn = tool.fn if hasattr(tool, "fn") else tool
+    while hasattr(fn, "__wrapped__"):
+        fn = fn.__wrapped__
+    return fn
+
+
+def _drive_service(files):
+    service = Mock()
+    service.files.return_value.list.return_value.execute = Mock(
+        return_value={"files": files}
+    )
+    return service
+
+
+@pytest.mark.asyncio
+async def test_search_docs_escapes_quotes_and_filters_native_docs():
+    service = _drive_service(
+        [
+            {
+                "id": "d1",
+                "name": "Bob's plan",
+                "modifiedTime": "2026-01-01T00:00:00Z",
+                "webViewLink": "https://docs.google.com/document/d/d1/edit",
+            }
+        ]
+    )
+
+    result = await _unwrap(docs_tools.search_docs)(
+        service=service, user_google_email="user@example.com", query="Bob's"
+    )
+
+    q = service.files.return_value.list.call_args.kwargs["q"]
+    assert q == (
+        "name contains 'Bob\\'s' and "
+        "mimeType='application/vnd.google-apps.document' and trashed=false"
+    )
+    assert result == (
+        "Found 1 Google Docs matching 'Bob's':\n"
+        "- Bob's plan (ID: d1) Modified: 2026-01-01T00:00:00Z "
+        "Link: https://docs.google.com/document/d/d1/edit"
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_docs_in_folder_filters_by_parent():
+    service = _drive_service([])
+
+    result = await _unwrap(docs_tools.list_docs_in_folder)(
+        service=service, user_google_email="user@example.com", folder_id="f1"
+    )
+
+    q = service.files.return_value.list.call_args.kwargs["q"]
+    assert q == (
+        "'f1' in parents and "
+        "mimeType='application/vnd.google-apps.document' and trashed=false"
+    )
+    assert result == "No Google Docs found in folder 'f1'."
+
+
+@pytest.mark.asyncio
+async def test_list_docs_in_folder_formats_one_line_per_doc():
+    service = _drive_service(
+        [
+            {"id": "d1", "name": "One", "modifiedTime": "t1", "webViewLink": "l1"},
+            {"id": "d2", "name": "Two"},
+        ]
+    )
+
+    result = await _unwrap(docs_tools.list_docs_in_folder)(
+        service=service, user_google_email="user@example.com", folder_id="f1"
+    )
+
+    assert result == (
+        "Found 2 Docs in folder 'f1':\n"
+        "- One (ID: d1) Modified: t1 Link: l1\n"
+        "- Two (ID: d2) Modified: None Link: None"
+    )
@@ -0,0 +1,104 @@
+"""Tests for plain-text extraction used by get_doc_content."""
+
+from gdocs import docs_tools
+
+
+def _para(*runs):
+    return {"paragraph": {"elements": [{"textRun": {"content": r}} for r in runs]}}
+
+
+def _table(*cells):
+    return {"table": {"tableRows": [{"tableCells": [{"content": c} for c in cells]}]}}
+
+
+def _doc_text(doc):
+    return "".join(docs_tools._iter_doc_text(doc))
+
+
+def test_paragraph_runs_joined_and_blank_lines_dropped():
+    doc = {
+        "body": {
+            "content": [
+                {"sectionBreak": {}},
+                _para("Hello ", "world\n"),
+                _para("   \n"),
+                {"paragraph": {"elements": [{"inlineObjectElement": {}}]}},
+                _para("Bye\n"),
+            ]
+        }
+    }
+
+    assert _doc_text(doc) == "Hello world\nBye\n"
+
+
+def test_table_cells_emitted_in_order_between_paragraphs():
+    doc = {
+        "body": {
+            "content": [
+                _para("Before\n"),
+                _table([_para("A1\n")], [_para("B1\n"), _table([_para("inner\n")])]),
+                _para("After\n"),
+            ]
+        }
+    }
+
+    assert _doc_text(doc) == "Before\nA1\nB1\ninner\nAfter\n"
+
+
+def test_tables_nested_beyond_limit_are_skipped():
+    content = [_para("deepest\n")]
+    for level in range(docs_tools.MAX_TABLE_NESTING_DEPTH + 1):
+        content = [_para(f"level {level}\n"), _table(content)]
+    doc = {"body": {"content": content}}
+
+    text = _doc_text(doc)
+
+    assert "level 0" in text
+    assert "deepest" not in text
+
+
+def test_tabs_and_child_tabs_include_indented_headers():
+    doc = {
+        "body": {"content": [_para("Main\n")]},
+        "tabs": [
+            {
+                "tabProperties": {"title": "Parent", "tabId": "t.1"},
+                "documentTab": {"body": {"content": [_para("Parent text\n")]}},
+                "childTabs": [
+                    {
+                        "tabProperties": {"title": "Child", "tabId": "t.2"},
+                        "documentTab": {"body": {"content": [_para("Child text\n")]}},
+                    }
+                ],
+            }
+        ],
+    }
+
+    assert _doc_text(doc) == (
+        "Main\n"
+        "\n--- TAB: Parent (ID: t.1) ---\n"
+        "Parent text\n"
+        "\n--- TAB:     Child (ID: t.2) ---\n"
+        "Child text\n"
+    )
+
+
+def test_tab_tree_walked_depth_first_in_order():
+    def tab(tab_id, *children):
+        return {
+            "tabProperties": {"title": tab_id, "tabId": tab_id},
+            "documentTab": {"body": {"content": []}},
+            "childTabs": list(children),
+        }
+
+    doc = {"tabs": [tab("a", tab("a1", tab("a1x")), tab("a2")), tab("b")]}
+
+    headers = [line.strip() for line in _doc_text(doc).splitlines() if line]
+
+    assert headers == [
+        "--- TAB: a (ID: a) ---",
+        "--- TAB:     a1 (ID: a1) ---",
+        "--- TAB:         a1x (ID: a1x) ---",
+        "--- TAB:     a2 (ID: a2) ---",
+        "--- TAB: b (ID: b) ---",
+    ]
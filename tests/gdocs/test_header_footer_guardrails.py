@@ -23,7 +23,6 @@ class TestHeaderFooterGuardrails:
 
         docs_api.get.return_value.execute.side_effect = [
             {"headers": {}, "footers": {}},
-            {"headers": {"hdr-123": {"content": []}}, "footers": {}},
         ]
         docs_api.batchUpdate.return_value.execute.side_effect = [
             {"replies": [{"createHeader": {"headerId": "hdr-123"}}]},
@@ -45,6 +44,8 @@ class TestHeaderFooterGuardrails:
         request = write_call.kwargs["body"]["requests"][0]["insertText"]
         assert request["text"] == "Board Draft"
         assert request["endOfSegmentLocation"] == {"segmentId": "hdr-123"}
+        # The new segment is written without re-reading the document
+        assert docs_api.get.return_value.execute.call_count == 1
 
     @pytest.mark.asyncio
     async def test_update_doc_headers_footers_skips_empty_range_delete(self):
@@ -86,6 +87,132 @@ class TestHeaderFooterGuardrails:
             "segmentId": "hdr-123"
         }
 
+    @pytest.mark.asyncio
+    async def test_update_doc_headers_footers_skips_write_when_text_matches(self):
+        service = Mock()
+        docs_api = service.documents.return_value
+
+        docs_api.get.return_value.execute.return_value = {
+            "documentStyle": {"defaultHeaderId": "hdr-123"},
+            "headers": {
+                "hdr-123": {
+                    "content": [
+                        {
+                            "startIndex": 0,
+                            "endIndex": 12,
+                            "paragraph": {
+                                "elements": [
+                                    {"textRun": {"content": "Header "}},
+                                    {"textRun": {"content": "Text\n"}},
+                                ]
+                            },
+                        }
+                    ]
+                }
+            },
+            "footers": {},
+            "body": {"content": []},
+        }
+
+        result = await _unwrap(docs_tools.update_doc_headers_footers)(
+            service=service,
+            user_google_email="user@example.com",
+            document_id="k" * 25,
+            section_type="header",
+            content="Header Text",
+        )
+
+        assert "No change needed" in result
+        docs_api.batchUpdate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_doc_headers_footers_batch_uses_batched_reads_and_writes(
+        self,
+    ):
+        def header_doc(text):
+            return {
+                "documentStyle": {"defaultHeaderId": "hdr-1"},
+                "headers": {
+                    "hdr-1": {
+                        "content": [
+                            {
+                                "startIndex": 0,
+                                "endIndex": len(text) + 1,
+                                "paragraph": {
+                                    "elements": [{"textRun": {"content": text + "\n"}}]
+                                },
+                            }
+                        ]
+                    }
+                },
+            }
+
+        docs = {
+            "a" * 25: header_doc("Old"),
+            "b" * 25: header_doc("Board Draft"),
+            "c" * 25: {"headers": {}, "footers": {}},
+        }
+
+        class FakeBatch:
+            def __init__(self, callback):
+                self.callback = callback
+                self.requests = []
+
+            def add(self, request, request_id):
+                self.requests.append((request_id, request))
+
+            def execute(self):
+                for request_id, request in self.requests:
+                    self.callback(request_id, request.execute(), None)
+
+        def get(documentId, **kwargs):
+            return Mock(execute=Mock(return_value=docs[documentId]))
+
+        def batch_update(documentId, body):
+            request = body["requests"][0]
+            reply = (
+                {"createHeader": {"headerId": "hdr-new"}}
+                if "createHeader" in request
+                else {}
+            )
+            return Mock(execute=Mock(return_value={"replies": [reply]}))
+
+        service = Mock()
+        docs_api = service.documents.return_value
+        docs_api.get.side_effect = get
+        docs_api.batchUpdate.side_effect = batch_update
+        service.new_batch_http_request.side_effect = lambda callback: FakeBatch(
+            callback
+        )
+
+        result = await _unwrap(docs_tools.update_doc_headers_footers_batch)(
+            service=service,
+            user_google_email="user@example.com",
+            document_ids=list(docs),
+            section_type="header",
+            content="Board Draft",
+        )
+
+        assert result.splitlines() == [
+            "Updated header in 3 of 3 documents. "
+            f"Runtime: {docs_tools.HEADER_FOOTER_RUNTIME_CANARY}.",
+            f"- {'a' * 25}: Updated header content in document {'a' * 25}",
+            f"- {'b' * 25}: No change needed: header in document {'b' * 25} "
+            "already contains the requested content",
+            f"- {'c' * 25}: Updated header content in document {'c' * 25}",
+        ]
+        # One batched read and one batched write; only the document without
+        # a header goes through the single-document create path.
+        assert service.new_batch_http_request.call_count == 2
+        written = [c.kwargs["documentId"] for c in docs_api.batchUpdate.call_args_list]
+        assert written == ["a" * 25, "c" * 25, "c" * 25]
+        replace = docs_api.batchUpdate.call_args_list[0].kwargs["body"]["requests"]
+        assert replace[0]["deleteContentRange"]["range"]["endIndex"] == 3
+        assert replace[1]["insertText"]["location"] == {
+            "segmentId": "hdr-1",
+            "index": 0,
+        }
+
     @pytest.mark.asyncio
     async def test_batch_update_doc_duplicate_header_creation_returns_guidance(self):
         service = Mock()
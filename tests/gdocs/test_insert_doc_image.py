@@ -0,0 +1,76 @@
+"""Tests for insert_doc_image Drive-source handling."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from gdocs import docs_tools
+
+
+def _unwrap(tool):
+    """Unwrap a FunctionTool + decorator chain to the original function."""
+    fn = tool.fn if hasattr(tool, "fn") else tool
+    while hasattr(fn, "__wrapped__"):
+        fn = fn.__wrapped__
+    return fn
+
+
+def _services(file_metadata):
+    drive_service = Mock()
+    drive_service.files.return_value.get.return_value.execute = Mock(
+        return_value=file_metadata
+    )
+    docs_service = Mock()
+    docs_service.documents.return_value.batchUpdate.return_value.execute = Mock(
+        return_value={"replies": [{}]}
+    )
+    return drive_service, docs_service
+
+
+async def _insert(drive_service, docs_service):
+    return await _unwrap(docs_tools.insert_doc_image)(
+        docs_service=docs_service,
+        drive_service=drive_service,
+        user_google_email="user@example.com",
+        document_id="doc123",
+        image_source="img456",
+        index=1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_private_drive_image_rejected_before_batch_update():
+    drive_service, docs_service = _services(
+        {
+            "id": "img456",
+            "name": "logo.png",
+            "mimeType": "image/png",
+            "permissions": [{"type": "user", "role": "owner"}],
+        }
+    )
+
+    result = await _insert(drive_service, docs_service)
+
+    assert "'logo.png' not shared publicly" in result
+    docs_service.documents.return_value.batchUpdate.assert_not_called()
+    fields = drive_service.files.return_value.get.call_args.kwargs["fields"]
+    assert "permissions" in fields
+
+
+@pytest.mark.parametrize(
+    "extra",
+    [
+        {"permissions": [{"type": "anyone", "role": "reader"}]},
+        {},  # ACL not visible to the caller
+    ],
+)
+@pytest.mark.asyncio
+async def test_public_or_unknown_acl_drive_image_is_inserted(extra):
+    drive_service, docs_service = _services(
+        {"id": "img456", "name": "logo.png", "mimeType": "image/png", **extra}
+    )
+
+    result = await _insert(drive_service, docs_service)
+
+    assert result.startswith("Inserted Drive file logo.png at index 1")
+    docs_service.documents.return_value.batchUpdate.assert_called_once()
@@ -13,7 +13,11 @@ from unittest.mock import AsyncMock, Mock
 from core.server import server
 from core.tool_registry import get_tool_components
 from gdocs import docs_tools
-from gdocs.docs_helpers import build_text_style, create_format_text_request
+from gdocs.docs_helpers import (
+    build_text_style,
+    create_format_text_request,
+    describe_text_format,
+)
 from gdocs.managers.validation_manager import ValidationManager
 
 SCHEMA_GOLDEN_PATH = (
@@ -75,6 +79,14 @@ class TestCreateFormatTextRequestStrikethrough:
         assert inner["range"]["tabId"] == "t.abc"
 
 
+class TestDescribeTextFormat:
+    def test_lists_set_options_in_order_with_units(self):
+        desc = describe_text_format(
+            {"font_size": 12, "strikethrough": True, "italic": None, "bold": False}
+        )
+        assert desc == "bold: False, strikethrough: True, font size: 12pt"
+
+
 class TestValidateTextFormattingStrikethrough:
     @pytest.fixture()
     def vm(self):
@@ -172,6 +184,21 @@ class TestPublicToolWiring:
         assert request["textStyle"]["strikethrough"] is True
         assert "strikethrough" in request["fields"]
 
+    @pytest.mark.asyncio
+    async def test_modify_doc_text_without_text_or_formatting_skips_api(self, service):
+        service.documents.return_value.batchUpdate.reset_mock()
+
+        result = await _unwrap(docs_tools.modify_doc_text)(
+            service=service,
+            user_google_email="user@example.com",
+            document_id="a" * 25,
+            start_index=1,
+            end_index=10,
+        )
+
+        assert result.startswith("Error: Must provide either 'text'")
+        service.documents.return_value.batchUpdate.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_batch_update_doc_public_tool_includes_strikethrough_in_request(
         self, service
@@ -60,6 +60,42 @@ async def test_get_doc_content_passes_suggestions_view_mode_to_docs_api():
     assert call_kwargs["documentId"] == "doc123"
     assert call_kwargs["includeTabsContent"] is True
     assert call_kwargs["suggestionsViewMode"] == "SUGGESTIONS_INLINE"
+    assert call_kwargs["fields"].startswith("body/content(paragraph/elements/")
+
+
+@pytest.mark.asyncio
+async def test_get_doc_content_include_tabs_false_reads_first_tab_body():
+    drive_service = Mock()
+    drive_service.files.return_value.get.return_value.execute = Mock(
+        return_value={
+            "id": "doc123",
+            "name": "Test Doc",
+            "mimeType": "application/vnd.google-apps.document",
+        }
+    )
+    docs_service = Mock()
+    docs_service.documents.return_value.get.return_value.execute = Mock(
+        return_value={
+            "body": {
+                "content": [
+                    {"paragraph": {"elements": [{"textRun": {"content": "Body\n"}}]}}
+                ]
+            }
+        }
+    )
+
+    result = await _unwrap(docs_tools.get_doc_content)(
+        drive_service=drive_service,
+        docs_service=docs_service,
+        user_google_email="user@example.com",
+        document_id="doc123",
+        include_tabs=False,
+    )
+
+    call_kwargs = docs_service.documents.return_value.get.call_args.kwargs
+    assert call_kwargs["includeTabsContent"] is False
+    assert result.endswith("Body\n")
+    assert "--- TAB:" not in result
 
 
 @pytest.mark.asyncio
@@ -112,3 +148,129 @@ async def test_get_doc_as_markdown_rejects_invalid_suggestions_view_mode():
     )
 
     assert "suggestions_view_mode must be one of" in result
+
+
+@pytest.mark.asyncio
+async def test_get_doc_content_downloads_drive_file_in_one_request():
+    drive_service = Mock()
+    drive_service.files.return_value.get.return_value.execute = Mock(
+        return_value={
+            "id": "file123",
+            "name": "notes.txt",
+            "mimeType": "text/plain",
+            "webViewLink": "https://drive.google.com/file/d/file123/view",
+        }
+    )
+    drive_service.files.return_value.get_media.return_value.execute = Mock(
+        return_value=b"plain file body"
+    )
+    # The speculative Docs fetch fails for non-native files and must be ignored.
+    docs_service = Mock()
+    docs_service.documents.return_value.get.return_value.execute = Mock(
+        side_effect=RuntimeError("not a Google Doc")
+    )
+
+    result = await _unwrap(docs_tools.get_doc_content)(
+        drive_service=drive_service,
+        docs_service=docs_service,
+        user_google_email="user@example.com",
+        document_id="file123",
+    )
+
+    assert result.endswith("plain file body")
+    drive_service.files.return_value.get_media.assert_called_once_with(
+        fileId="file123", supportsAllDrives=True
+    )
+    drive_service.files.return_value.get_media.return_value.execute.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_get_doc_content_propagates_metadata_error():
+    drive_service = Mock()
+    drive_service.files.return_value.get.return_value.execute = Mock(
+        side_effect=RuntimeError("File not found")
+    )
+
+    with pytest.raises(RuntimeError, match="File not found"):
+        await _unwrap(docs_tools.get_doc_content)(
+            drive_service=drive_service,
+            docs_service=Mock(),
+            user_google_email="user@example.com",
+            document_id="missing",
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_doc_content_reuses_text_for_unchanged_drive_version(monkeypatch):
+    monkeypatch.setattr(docs_tools, "_doc_text_cache", docs_tools.OrderedDict())
+    metadata = {
+        "id": "file123",
+        "name": "notes.txt",
+        "mimeType": "text/plain",
+        "version": "7",
+    }
+    drive_service = Mock()
+    drive_service.files.return_value.get.return_value.execute = Mock(
+        side_effect=lambda: dict(metadata)
+    )
+    media_execute = drive_service.files.return_value.get_media.return_value.execute
+    media_execute.side_effect = [b"first body", b"second body"]
+    docs_service = Mock()
+    docs_service.documents.return_value.get.return_value.execute = Mock(
+        side_effect=RuntimeError("not a Google Doc")
+    )
+
+    async def fetch():
+        return await _unwrap(docs_tools.get_doc_content)(
+            drive_service=drive_service,
+            docs_service=docs_service,
+            user_google_email="user@example.com",
+            document_id="file123",
+        )
+
+    assert (await fetch()).endswith("first body")
+    assert (await fetch()).endswith("first body")
+    assert media_execute.call_count == 1
+
+    metadata["version"] = "8"
+    assert (await fetch()).endswith("second body")
+    assert media_execute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_doc_content_does_not_cache_native_docs(monkeypatch):
+    monkeypatch.setattr(docs_tools, "_doc_text_cache", docs_tools.OrderedDict())
+    drive_service = Mock()
+    drive_service.files.return_value.get.return_value.execute = Mock(
+        return_value={
+            "id": "doc123",
+            "name": "Test Doc",
+            "mimeType": "application/vnd.google-apps.document",
+            "version": "3",
+        }
+    )
+    docs_service = Mock()
+    doc_execute = docs_service.documents.return_value.get.return_value.execute
+    doc_execute.side_effect = [
+        {
+            "body": {
+                "content": [
+                    {"paragraph": {"elements": [{"textRun": {"content": body}}]}}
+                ]
+            }
+        }
+        for body in ("Editor view\n", "Viewer view\n")
+    ]
+
+    async def fetch(email):
+        return await _unwrap(docs_tools.get_doc_content)(
+            drive_service=drive_service,
+            docs_service=docs_service,
+            user_google_email=email,
+            document_id="doc123",
+        )
+
+    assert (await fetch("editor@example.com")).endswith("Editor view\n")
+    assert (await fetch("viewer@example.com")).endswith("Viewer view\n")
+    assert doc_execute.call_count == 2
+    assert not docs_tools._doc_text_cache
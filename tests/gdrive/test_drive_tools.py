@@ -1943,3 +1943,38 @@ async def test_update_drive_file_metadata_only_uploads_no_media(mock_resolve_ite
     update_kwargs = mock_service.files.return_value.update.call_args.kwargs
     assert "media_body" not in update_kwargs
     assert "Successfully updated file" in result
+
+
+@pytest.mark.parametrize(
+    "permissions, expected",
+    [
+        ([{"type": "anyone", "role": "reader"}], True),
+        (
+            [{"type": "user", "role": "owner"}, {"type": "anyone", "role": "writer"}],
+            True,
+        ),
+        ([{"type": "anyone", "role": "owner"}], False),
+        ([{"type": "domain", "role": "reader"}], False),
+        ([], False),
+        (None, False),
+    ],
+)
+def test_check_public_link_permission(permissions, expected):
+    from gdrive.drive_helpers import check_public_link_permission
+
+    assert check_public_link_permission(permissions) is expected
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("plain", "plain"),
+        ("Bob's", "Bob\\'s"),
+        ("C:\\temp", "C:\\\\temp"),
+        ("a\\'b", "a\\\\\\'b"),
+    ],
+)
+def test_escape_drive_query_value(raw, expected):
+    from gdrive.drive_helpers import escape_drive_query_value
+
+    assert escape_drive_query_value(raw) == expected